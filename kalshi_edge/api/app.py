@@ -1,26 +1,53 @@
 """FastAPI app exposing backtest summaries and calibration."""
 from __future__ import annotations
 
+import contextlib
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List
-from datetime import datetime, timezone, timedelta
-
-from fastapi import FastAPI, Request
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import FastAPI, Query, Request
+from jinja2 import FileSystemBytecodeCache
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from ..backtest.results_store import (
     get_all_latest_backtest_results,
     get_latest_calibration_result,
+    get_threshold_results,
     list_backtest_results,
     list_calibration_results,
 )
-from ..db import get_connection
+from ..db import borrowed_connection, close_pool, get_connection, open_pool
 from ..signals.generate_signals import generate_signals
 from ..execution.execute_signals import execute_signals
 from ..config import get_initial_bankroll_usd
 
-app = FastAPI(title="Kalshi Edge Dashboard")
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Warm the connection pool and templates on startup; drain on shutdown."""
+
+    open_pool()
+    for name in ("dashboard.html", "reports.html"):
+        templates.env.get_template(name)
+    yield
+    close_pool()
+
+
+app = FastAPI(
+    title="Kalshi Edge Dashboard",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
 templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent.parent.parent / "templates"))
+# Templates only change on deploy, so skip the per-render mtime stat and keep
+# compiled bytecode across worker restarts.
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 
 def _run_strategy_summary(run_fn) -> Dict[str, Any]:
@@ -40,23 +67,34 @@ def health() -> Dict[str, str]:
 
 @app.get("/summary")
 def summary() -> Dict[str, Any]:
+    return _cached("summary", _build_summary)
+
+
+# Backward-compatible lookup keys for legacy dashboard cards, most specific
+# first; bound once so _build_summary does not rebuild the tuples per request.
+_STRATEGY_0_90_KEYS = ("strategy_0_90", "threshold_yes_0.90", "threshold_yes_0.9")
+_STRATEGY_0_10_KEYS = ("strategy_0_10", "threshold_no_0.10", "threshold_no_0.1")
+
+
+def _latest_with_fallback(
+    latest: Dict[str, Any], keys: Tuple[str, ...]
+) -> Optional[Dict[str, Any]]:
+    for key in keys:
+        result = latest.get(key)
+        if result:
+            return result
+    return None
+
+
+def _build_summary() -> Dict[str, Any]:
     latest = get_all_latest_backtest_results()
-    # Backward-compatible keys for legacy dashboard cards.
-    strategy_0_90 = (
-        latest.get("strategy_0_90")
-        or latest.get("threshold_yes_0.90")
-        or latest.get("threshold_yes_0.9")
-    )
-    strategy_0_10 = (
-        latest.get("strategy_0_10")
-        or latest.get("threshold_no_0.10")
-        or latest.get("threshold_no_0.1")
-    )
-    strategies = dict(latest)
-    strategies["strategy_0_90"] = strategy_0_90
-    strategies["strategy_0_10"] = strategy_0_10
+    strategy_0_90 = _latest_with_fallback(latest, _STRATEGY_0_90_KEYS)
+    strategy_0_10 = _latest_with_fallback(latest, _STRATEGY_0_10_KEYS)
+    # `latest` is shared through the results-store cache, so overlay the two
+    # legacy keys into the response copy instead of mutating it in place.
+    # This copy only runs on summary-cache misses, not per request.
     return {
-        "strategies": strategies,
+        "strategies": {**latest, "strategy_0_90": strategy_0_90, "strategy_0_10": strategy_0_10},
         "strategy_0_90": strategy_0_90,
         "strategy_0_10": strategy_0_10,
     }
@@ -64,86 +102,205 @@ def summary() -> Dict[str, Any]:
 
 @app.get("/calibration")
 def calibration_buckets() -> List[Dict[str, Any]]:
-    result = get_latest_calibration_result(binning_mode="extreme")
-    if not result:
-        return []
-    return result["buckets"]
-
-
-def get_recent_signals(limit: int = 100) -> List[Dict[str, Any]]:
-    def classify_rule(sig: Dict[str, Any]) -> str:
-        """Lightweight justification tag based on pricing/rules."""
-
-        side = (sig.get("side") or "").lower()
-        p = float(sig.get("p_mkt") or 0.0)
-        yes_prob = p if side == "yes" else (1.0 - p)
-
-        if 0.88 <= yes_prob <= 0.92:
-            return "Primary 88-92% rule"
-        if yes_prob <= 0.02:
-            return "College long-shot rule"
-        if yes_prob <= 0.15:
-            return "Pro long-shot rule"
-        return "Other/override"
-
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT created_at, market_ticker, side, threshold, category, expiry_bucket,
-                   p_mkt, p_true_est, expected_value, size, status,
-                   execution_mode, order_id, executed_price, executed_size, last_error
-            FROM signals
-            ORDER BY
-              CASE
-                WHEN status = 'pending' THEN 0
-                WHEN status = 'resting' THEN 1
-                WHEN status = 'sent' THEN 2
-                WHEN status = 'simulated' THEN 3
-                WHEN status = 'executed' THEN 4
-                WHEN status = 'ignored' THEN 5
-                WHEN status = 'error' THEN 6
-                ELSE 7
-              END,
-              created_at DESC
-            LIMIT %s
-            """,
-            (limit,),
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
-
-    keys = [
-        "created_at",
-        "market_ticker",
-        "side",
-        "threshold",
-        "category",
-        "expiry_bucket",
-        "p_mkt",
-        "p_true_est",
-        "expected_value",
-        "size",
-        "status",
-        "execution_mode",
-        "order_id",
-        "executed_price",
-        "executed_size",
-        "last_error",
-    ]
+    def producer() -> List[Dict[str, Any]]:
+        result = get_latest_calibration_result(binning_mode="extreme")
+        return result["buckets"] if result else []
+
+    return _cached("calibration", producer)
+
+
+# Column tuples matching the SELECT lists below, bound once at import time so
+# row hydration does not rebuild the key list (and re-hash it) per request.
+_SIGNAL_COLS = (
+    "created_at",
+    "market_ticker",
+    "side",
+    "threshold",
+    "category",
+    "expiry_bucket",
+    "p_mkt",
+    "p_true_est",
+    "expected_value",
+    "size",
+    "status",
+    "execution_mode",
+    "order_id",
+    "executed_price",
+    "executed_size",
+    "last_error",
+)
+_POSITION_COLS = (
+    "market_ticker",
+    "side",
+    "size",
+    "avg_entry_price",
+    "realized_pnl",
+    "category",
+    "expiration_ts",
+)
+_PNL_COLS = ("as_of_date", "realized_pnl", "unrealized_pnl", "total_equity")
+_TRADE_COLS = ("executed_at", "market_ticker", "side", "direction", "size", "price")
+
+# Positional indexes into a raw signal row, so derived fields can be computed
+# straight off the fetched tuple instead of going through the hydrated dict.
+_SIG_SIDE_IDX = _SIGNAL_COLS.index("side")
+_SIG_PMKT_IDX = _SIGNAL_COLS.index("p_mkt")
+
+# Hot query text bound once at import time. psycopg2 has no protocol-level
+# prepared statements, but hoisting the strings avoids rebuilding them per
+# request and keeps the statement text byte-identical so the server's plan
+# cache can do its job on pooled sessions.
+_RECENT_SIGNALS_SQL = """
+    SELECT created_at, market_ticker, side, threshold, category, expiry_bucket,
+           p_mkt, p_true_est, expected_value, size, status,
+           execution_mode, order_id, executed_price, executed_size, last_error
+    FROM signals
+    ORDER BY status_rank, created_at DESC
+    LIMIT %s
+"""
+_POSITIONS_SQL = """
+    SELECT p.market_ticker, p.side, p.size, p.avg_entry_price, p.realized_pnl, m.category, m.expiration_ts
+    FROM positions p
+    LEFT JOIN markets m ON p.market_ticker = m.market_id
+    ORDER BY p.updated_at DESC
+"""
+_DAILY_PNL_SQL = """
+    SELECT as_of_date, realized_pnl, unrealized_pnl, total_equity
+    FROM (
+        SELECT as_of_date, realized_pnl, unrealized_pnl, total_equity
+        FROM account_pnl
+        ORDER BY as_of_date DESC
+        LIMIT %s
+    ) recent
+    ORDER BY as_of_date ASC
+"""
+_TRADES_SQL = """
+    SELECT executed_at, market_ticker, side, direction, size, price
+    FROM trades
+    ORDER BY executed_at DESC
+    LIMIT %s
+"""
+
+_EXPOSURE_SQL = """
+    SELECT
+      COALESCE((
+        SELECT SUM(
+          CASE WHEN LOWER(COALESCE(p.side, '')) = 'no'
+               THEN (1.0 - norm.price) * ABS(COALESCE(p.size, 0))
+               ELSE norm.price * ABS(COALESCE(p.size, 0))
+          END)
+        FROM positions p
+        LEFT JOIN markets m ON p.market_ticker = m.market_id
+        CROSS JOIN LATERAL (
+          SELECT GREATEST(
+            CASE WHEN COALESCE(p.avg_entry_price, 0.0) > 1.0
+                 THEN COALESCE(p.avg_entry_price, 0.0) / 100.0
+                 ELSE COALESCE(p.avg_entry_price, 0.0)
+            END,
+            0.0) AS price
+        ) norm
+        WHERE m.expiration_ts IS NOT NULL
+          AND m.expiration_ts >= NOW()
+          AND (p.updated_at IS NULL OR p.updated_at >= NOW() - INTERVAL '2 days')
+      ), 0.0) AS positions_exposure,
+      COALESCE((
+        SELECT SUM(
+          CASE WHEN LOWER(COALESCE(s.side, '')) = 'no'
+               THEN (1.0 - norm.price) * ABS(COALESCE(s.size, 0))
+               ELSE norm.price * ABS(COALESCE(s.size, 0))
+          END)
+        FROM signals s
+        CROSS JOIN LATERAL (
+          SELECT GREATEST(
+            CASE WHEN COALESCE(s.p_mkt, 0.0) > 1.0
+                 THEN COALESCE(s.p_mkt, 0.0) / 100.0
+                 ELSE COALESCE(s.p_mkt, 0.0)
+            END,
+            0.0) AS price
+        ) norm
+        WHERE s.status IN ('pending', 'sent', 'resting', 'simulated')
+      ), 0.0) AS signals_exposure
+    """
+
+
+# Short-TTL cache for read endpoints whose backing data only changes when the
+# scheduler or an admin action writes; keeps bursty dashboard polling from
+# re-running the same aggregate queries every few hundred milliseconds.
+_CACHE_TTL_SECONDS = 10.0
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cached(key: str, producer: Callable[[], Any], ttl: float = _CACHE_TTL_SECONDS) -> Any:
+    now = time.monotonic()
+    with _response_cache_lock:
+        hit = _response_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+    value = producer()
+    with _response_cache_lock:
+        _response_cache[key] = (now + ttl, value)
+    return value
+
+
+def _invalidate_response_cache() -> None:
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def _fetch_rows(sql: str, params: Tuple[Any, ...] = (), conn: Any = None) -> List[Tuple]:
+    with borrowed_connection(conn) as c:
+        cur = c.cursor()
+        cur.execute(sql, params or None)
+        return cur.fetchall()
+
+
+def _ndjson_response(cols: Tuple[str, ...], rows: List[Tuple]) -> StreamingResponse:
+    """Stream rows as newline-delimited JSON, serializing one row at a time."""
+
+    def lines():
+        for row in rows:
+            yield orjson.dumps(dict(zip(cols, row)), default=str) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _classify_rule(side: Any, p_mkt: Any) -> str:
+    """Lightweight justification tag based on pricing/rules."""
+
+    p = float(p_mkt or 0.0)
+    yes_prob = p if (side or "").lower() == "yes" else (1.0 - p)
+
+    if 0.88 <= yes_prob <= 0.92:
+        return "Primary 88-92% rule"
+    if yes_prob <= 0.02:
+        return "College long-shot rule"
+    if yes_prob <= 0.15:
+        return "Pro long-shot rule"
+    return "Other/override"
+
+
+def get_recent_signals(limit: int = 100, conn: Any = None) -> List[Dict[str, Any]]:
+    rows = _fetch_rows(_RECENT_SIGNALS_SQL, (limit,), conn)
     out: List[Dict[str, Any]] = []
     for row in rows:
-        sig = dict(zip(keys, row))
-        sig["rule"] = classify_rule(sig)
+        sig = dict(zip(_SIGNAL_COLS, row))
+        sig["rule"] = _classify_rule(row[_SIG_SIDE_IDX], row[_SIG_PMKT_IDX])
         out.append(sig)
     return out
 
 
 @app.get("/signals")
-def list_signals(limit: int = 100) -> List[Dict[str, Any]]:
-    return get_recent_signals(limit=limit)
+async def list_signals(limit: int = Query(100, ge=1, le=1000)) -> List[Dict[str, Any]]:
+    return await run_in_threadpool(get_recent_signals, limit=limit)
+
+
+@app.get("/signals/stream")
+async def stream_signals(limit: int = Query(1000, ge=1, le=10000)) -> StreamingResponse:
+    """Bulk signal export as NDJSON; avoids materializing one large JSON body."""
+
+    rows = await run_in_threadpool(_fetch_rows, _RECENT_SIGNALS_SQL, (limit,))
+    return _ndjson_response(_SIGNAL_COLS, rows)
 
 
 @app.post("/signals/cancel_open")
@@ -163,6 +320,7 @@ def cancel_open_signals() -> Dict[str, Any]:
         )
         cancelled = cur.rowcount
         conn.commit()
+    _invalidate_response_cache()
     return {"cancelled": cancelled}
 
 
@@ -189,71 +347,68 @@ def admin_reset_budget() -> Dict[str, Any]:
     initial = get_initial_bankroll_usd()
     today = datetime.now(timezone.utc).date()
     with get_connection() as conn, conn.cursor() as cur:
-        cur.execute("TRUNCATE account_pnl;")
+        # Single round trip: psycopg2 sends the whole multi-statement string
+        # in one go and the statements still run inside one transaction.
         cur.execute(
             """
+            TRUNCATE account_pnl;
             INSERT INTO account_pnl (as_of_date, realized_pnl, unrealized_pnl, total_equity, created_at)
             VALUES (%s, %s, %s, %s, NOW())
             """,
             (today, 0.0, 0.0, initial),
         )
         conn.commit()
+    _invalidate_response_cache()
     return {"reset": True, "total_equity": initial}
 
 
-def get_signal_status_summary() -> Dict[str, Any]:
-    """Return counts by status and the latest signal timestamp."""
+_STATUS_SUMMARY_SQL = """
+    SELECT
+      s.status,
+      COUNT(*) AS cnt,
+      MAX(s.created_at) AS max_created_at,
+      COALESCE(SUM(
+        CASE WHEN s.status = 'resting'
+             THEN (CASE WHEN LOWER(COALESCE(s.side, '')) = 'no'
+                        THEN 1.0 - norm.price
+                        ELSE norm.price
+                   END) * ABS(COALESCE(s.size, 0))
+             ELSE 0.0
+        END), 0.0) AS resting_risk
+    FROM signals s
+    CROSS JOIN LATERAL (
+      SELECT GREATEST(
+        CASE WHEN COALESCE(s.p_mkt, 0.0) > 1.0
+             THEN COALESCE(s.p_mkt, 0.0) / 100.0
+             ELSE COALESCE(s.p_mkt, 0.0)
+        END,
+        0.0) AS price
+    ) norm
+    GROUP BY s.status
+"""
+
+
+def get_signal_status_summary(conn: Any = None) -> Dict[str, Any]:
+    """Return counts by status and the latest signal timestamp.
+
+    One grouped query covers the status counts, the newest created_at, and the
+    approximate resting-order risk (price normalized cents -> dollars and
+    clamped at zero, same rule as the exposure query) that previously took
+    three round trips plus a Python loop.
+    """
 
-    conn = get_connection()
     counts: Dict[str, int] = {}
     latest_ts = None
     resting_risk = 0.0
-    open_order_cost = 0.0
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT status, count(*)
-            FROM signals
-            GROUP BY status
-            """
-        )
-        for status, cnt in cur.fetchall():
+    with borrowed_connection(conn) as c:
+        cur = c.cursor()
+        cur.execute(_STATUS_SUMMARY_SQL)
+        for status, cnt, max_created_at, risk in cur.fetchall():
             counts[str(status)] = int(cnt)
-
-        cur.execute("SELECT max(created_at) FROM signals")
-        row = cur.fetchone()
-        if row and row[0]:
-            latest_ts = row[0]
-
-        # Compute approximate risk for resting orders.
-        cur.execute(
-            """
-            SELECT side, p_mkt, size
-            FROM signals
-            WHERE status = 'resting'
-            """
-        )
-        for side, p_mkt, size in cur.fetchall():
-            try:
-                price = float(p_mkt or 0.0)
-            except Exception:
-                price = 0.0
-            if price > 1.0:
-                price = price / 100.0
-            if price < 0:
-                price = 0.0
-            sz = abs(int(size or 0))
-            if sz <= 0:
-                continue
-            if (side or "").lower() == "no":
-                resting_risk += (1.0 - price) * sz
-                open_order_cost += (1.0 - price) * sz
-            else:
-                resting_risk += price * sz
-                open_order_cost += price * sz
-    finally:
-        conn.close()
+            if max_created_at is not None and (latest_ts is None or max_created_at > latest_ts):
+                latest_ts = max_created_at
+            resting_risk += float(risk)
+    open_order_cost = resting_risk
 
     open_count = sum(
         counts.get(s, 0) for s in ("pending", "resting", "sent", "simulated")
@@ -274,167 +429,108 @@ def get_signal_status_summary() -> Dict[str, Any]:
     }
 
 
+def get_positions(conn: Any = None) -> List[Dict[str, Any]]:
+    rows = _fetch_rows(_POSITIONS_SQL, conn=conn)
+    return [dict(zip(_POSITION_COLS, row)) for row in rows]
+
+
 @app.get("/positions")
-def list_positions() -> List[Dict[str, Any]]:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.market_ticker, p.side, p.size, p.avg_entry_price, p.realized_pnl, m.category, m.expiration_ts
-            FROM positions p
-            LEFT JOIN markets m ON p.market_ticker = m.market_id
-            ORDER BY p.updated_at DESC
-            """
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
-    keys = ["market_ticker", "side", "size", "avg_entry_price", "realized_pnl", "category", "expiration_ts"]
-    return [dict(zip(keys, row)) for row in rows]
+async def list_positions() -> List[Dict[str, Any]]:
+    return await run_in_threadpool(get_positions)
+
+
+def get_daily_pnl(limit: int = 90, conn: Any = None) -> List[Dict[str, Any]]:
+    rows = _fetch_rows(_DAILY_PNL_SQL, (limit,), conn)
+    return [dict(zip(_PNL_COLS, row)) for row in rows]
 
 
 @app.get("/pnl/daily")
-def list_daily_pnl(limit: int = 90) -> List[Dict[str, Any]]:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT as_of_date, realized_pnl, unrealized_pnl, total_equity
-            FROM account_pnl
-            ORDER BY as_of_date DESC
-            LIMIT %s
-            """,
-            (limit,),
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
-    keys = ["as_of_date", "realized_pnl", "unrealized_pnl", "total_equity"]
-    formatted: List[Dict[str, Any]] = []
-    for row in rows:
-        item = dict(zip(keys, row))
-        if item.get("as_of_date") is not None:
-            item["as_of_date"] = item["as_of_date"].isoformat()
-        formatted.append(item)
-    return formatted[::-1]
+async def list_daily_pnl(limit: int = Query(90, ge=1, le=1000)) -> List[Dict[str, Any]]:
+    return await run_in_threadpool(
+        _cached, f"pnl_daily:{limit}", lambda: get_daily_pnl(limit=limit)
+    )
+
+
+def get_trades(limit: int = 100, conn: Any = None) -> List[Dict[str, Any]]:
+    rows = _fetch_rows(_TRADES_SQL, (limit,), conn)
+    return [dict(zip(_TRADE_COLS, row)) for row in rows]
 
 
 @app.get("/pnl/trades")
-def list_trades(limit: int = 100) -> List[Dict[str, Any]]:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT executed_at, market_ticker, side, direction, size, price
-            FROM trades
-            ORDER BY executed_at DESC
-            LIMIT %s
-            """,
-            (limit,),
-        )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
-    keys = ["executed_at", "market_ticker", "side", "direction", "size", "price"]
-    return [dict(zip(keys, row)) for row in rows]
-
-
-def get_current_exposure() -> Dict[str, float]:
-    """Estimate current risk in play from positions and open signals."""
-
-    def _norm_price(price: float) -> float:
-        try:
-            p = float(price or 0.0)
-        except Exception:
-            return 0.0
-        if p > 1.0:
-            p = p / 100.0
-        if p < 0:
-            p = 0.0
-        return p
-
-    def _risk(side: str, price: float, size: int) -> float:
-        side = (side or "").lower()
-        price_f = _norm_price(price)
-        size_i = abs(int(size or 0))
-        if size_i <= 0:
-            return 0.0
-        return (1.0 - price_f) * size_i if side == "no" else price_f * size_i
-
-    pos_risk = 0.0
-    sig_risk = 0.0
-
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.side, p.avg_entry_price, p.size, m.expiration_ts, p.updated_at
-            FROM positions p
-            LEFT JOIN markets m ON p.market_ticker = m.market_id
-            """
-        )
-        now = datetime.now(timezone.utc)
-        stale_cutoff = now - timedelta(days=2)
-        for side, avg_price, size, expiration_ts, updated_at in cur.fetchall():
-            # Ignore positions with no known future expiry or very stale rows.
-            if not expiration_ts or expiration_ts < now:
-                continue
-            if updated_at and updated_at < stale_cutoff:
-                continue
-            pos_risk += _risk(side, avg_price, size)
+async def list_trades(limit: int = Query(100, ge=1, le=1000)) -> List[Dict[str, Any]]:
+    return await run_in_threadpool(get_trades, limit=limit)
 
-        cur.execute(
-            """
-            SELECT side, p_mkt, size
-            FROM signals
-            WHERE status IN ('pending', 'sent', 'resting', 'simulated')
-            """
-        )
-        for side, p_mkt, size in cur.fetchall():
-            sig_risk += _risk(side, p_mkt, size)
-    finally:
-        conn.close()
 
-    total = pos_risk + sig_risk
+@app.get("/pnl/trades/stream")
+async def stream_trades(limit: int = Query(1000, ge=1, le=10000)) -> StreamingResponse:
+    """Bulk trade export as NDJSON; avoids materializing one large JSON body."""
+
+    rows = await run_in_threadpool(_fetch_rows, _TRADES_SQL, (limit,))
+    return _ndjson_response(_TRADE_COLS, rows)
+
+
+def get_current_exposure(conn: Any = None) -> Dict[str, float]:
+    """Estimate current risk in play from positions and open signals.
+
+    Both legs are aggregated server-side in one statement: prices are
+    normalized (cents -> dollars, clamped at zero) and risk is price * size
+    for YES exposure or (1 - price) * size for NO exposure, mirroring the
+    old Python loop. Positions with no known future expiry or very stale
+    updates are excluded, with both cutoffs computed server-side off NOW().
+    """
+
+    with borrowed_connection(conn) as c:
+        cur = c.cursor()
+        cur.execute(_EXPOSURE_SQL)
+        pos_risk, sig_risk = cur.fetchone()
+
+    pos_risk = float(pos_risk)
+    sig_risk = float(sig_risk)
     return {
-        "total_exposure": total,
+        "total_exposure": pos_risk + sig_risk,
         "positions_exposure": pos_risk,
         "signals_exposure": sig_risk,
     }
 
 
 @app.get("/exposure")
-def exposure() -> Dict[str, float]:
-    return get_current_exposure()
+async def exposure() -> Dict[str, float]:
+    return await run_in_threadpool(get_current_exposure)
+
+
+def _dashboard_state() -> Dict[str, Any]:
+    """Fetch everything the dashboard shows over one pooled connection."""
+
+    thresholds = get_threshold_results()
+    with borrowed_connection() as conn:
+        return {
+            "thresholds": thresholds,
+            "signals": get_recent_signals(limit=50, conn=conn),
+            "positions": get_positions(conn=conn),
+            "trades": get_trades(limit=50, conn=conn),
+            "pnl_series": get_daily_pnl(limit=90, conn=conn),
+            "exposure": get_current_exposure(conn=conn),
+            "signal_status": get_signal_status_summary(conn=conn),
+        }
+
+
+@app.get("/api/dashboard_state")
+async def dashboard_state() -> Dict[str, Any]:
+    """All dashboard data as one JSON payload for client-side polling."""
+
+    return await run_in_threadpool(_cached, "dashboard_state", _dashboard_state)
 
 
 @app.get("/")
 def dashboard(request: Request) -> Any:
-    latest = get_all_latest_backtest_results()
-    thresholds = {k: v for k, v in latest.items() if k.startswith("threshold_")}
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
-            "thresholds": thresholds,
-            "signals": get_recent_signals(limit=50),
-            "positions": list_positions(),
-            "trades": list_trades(limit=50),
-            "pnl_series": list_daily_pnl(limit=90),
-            "exposure": get_current_exposure(),
-            "signal_status": get_signal_status_summary(),
-        },
-    )
+    context = {"request": request, **_cached("dashboard_state", _dashboard_state)}
+    return templates.TemplateResponse("dashboard.html", context)
 
 
 @app.get("/reports")
 def reports(request: Request) -> Any:
-    backtests = list_backtest_results(limit=200)
-    calibrations = list_calibration_results(limit=50)
+    backtests = _cached("reports_backtests", lambda: list_backtest_results(limit=200))
+    calibrations = _cached("reports_calibrations", lambda: list_calibration_results(limit=50))
     return templates.TemplateResponse(
         "reports.html",
         {
@@ -3,14 +3,13 @@ from __future__ import annotations
 
 import argparse
 import csv
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-
-from psycopg2.extras import RealDictCursor
+from typing import Any, Callable, Dict, List
 
 from ..db import connection_ctx
 from ..util.logging import get_logger
-from .common import compute_mid_price
+from .common import mid_price
 
 LOGGER = get_logger(__name__)
 DEFAULT_BINS = 10
@@ -45,91 +44,98 @@ def _bucket_edges(num_bins: int) -> List[Dict[str, Any]]:
     return _init_buckets_from_edges(edges)
 
 
-def _bucket_index(p_mkt: float, num_bins: int) -> int:
-    if p_mkt <= 0:
-        return 0
-    if p_mkt >= 1:
-        return num_bins - 1
-    return min(int(p_mkt * num_bins), num_bins - 1)
+def _make_uniform_selector(num_bins: int) -> Callable[[float], int]:
+    """Build a bucket selector with ``num_bins`` bound at creation time.
+
+    The returned closure reads only locals, so the per-price call does one
+    multiply, one int conversion, and a clamp — no argument re-validation
+    or attribute lookups in the hot loop.
+    """
+
+    last = num_bins - 1
+
+    def selector(p_mkt: float) -> int:
+        if p_mkt <= 0.0:
+            return 0
+        idx = int(p_mkt * num_bins)
+        return last if idx > last else idx
+
+    return selector
 
 
 def _bucket_from_edges(p_mkt: float, edges: List[float]) -> int:
-    if p_mkt <= edges[0]:
+    # Binary search replaces the old linear scan over edge pairs. Buckets are
+    # lower-inclusive with the final bucket also including its upper edge,
+    # which is exactly what bisect_right - 1 plus clamping yields.
+    idx = bisect_right(edges, p_mkt) - 1
+    if idx < 0:
         return 0
-    if p_mkt >= edges[-1]:
-        return len(edges) - 2
-    for idx, (low, high) in enumerate(zip(edges[:-1], edges[1:])):
-        inclusive_high = idx == (len(edges) - 2)
-        if low <= p_mkt < high or (inclusive_high and p_mkt <= high):
-            return idx
-    return len(edges) - 2
-
-
-def _latest_price(cursor: RealDictCursor, market_id: str, resolved_at: Optional[Any]) -> Optional[Dict[str, Any]]:
-    if resolved_at:
-        cursor.execute(
-            """
-            SELECT timestamp, bid_yes, ask_yes, last_yes, volume, open_interest
-            FROM prices
-            WHERE market_id = %s AND timestamp <= %s
-            ORDER BY timestamp DESC
-            LIMIT 1
-            """,
-            (market_id, resolved_at),
-        )
-    else:
-        cursor.execute(
-            """
-            SELECT timestamp, bid_yes, ask_yes, last_yes, volume, open_interest
-            FROM prices
-            WHERE market_id = %s
-            ORDER BY timestamp DESC
-            LIMIT 1
-            """,
-            (market_id,),
-        )
-    return cursor.fetchone()
+    last = len(edges) - 2
+    return last if idx > last else idx
+
+
+# Latest pre-resolution price for every resolved market, in one statement.
+# DISTINCT ON keeps only the newest price row per market, so the old
+# query-per-market loop collapses into a single round trip. The float8 casts
+# skip the Decimal psycopg2 would otherwise build per NUMERIC cell.
+_LATEST_RESOLVED_PRICES_SQL = """
+    SELECT DISTINCT ON (p.market_id)
+        p.market_id,
+        m.resolution,
+        p.bid_yes::float8,
+        p.ask_yes::float8,
+        p.last_yes::float8
+    FROM markets m
+    JOIN prices p ON p.market_id = m.market_id
+    WHERE m.resolution IS NOT NULL
+      AND (m.resolved_at IS NULL OR p.timestamp <= m.resolved_at)
+    ORDER BY p.market_id, p.timestamp DESC
+"""
 
 
 def _compute_calibration_generic(
     buckets: List[Dict[str, Any]],
     selector: Callable[[float], int],
 ) -> List[Dict[str, Any]]:
+    # Accumulate into parallel arrays indexed by bucket instead of mutating
+    # the bucket dicts row by row; the dicts are populated in one final pass.
+    # The aggregation is deliberately single-threaded: the scan is bound by
+    # the server-side query and row streaming, not by the per-row arithmetic,
+    # so fanning the tally across cores would only add merge overhead.
+    num_buckets = len(buckets)
+    n_arr = [0] * num_buckets
+    n_yes_arr = [0] * num_buckets
+    p_sum_arr = [0.0] * num_buckets
     with connection_ctx() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                SELECT market_id, resolution, resolved_at
-                FROM markets
-                WHERE resolution IS NOT NULL
-                """
-            )
-            markets = cursor.fetchall()
-            for market in markets:
-                price_row = _latest_price(cursor, market["market_id"], market["resolved_at"])
-                if not price_row:
-                    continue
-                p_mkt = compute_mid_price(price_row)
+        # Named cursor keeps the result set server-side and streams it in
+        # itersize chunks, so memory stays bounded on large price histories.
+        # Plain tuple rows skip the dict-per-row allocation of RealDictCursor.
+        with conn.cursor(name="calibration_scan") as cursor:
+            cursor.itersize = 10_000
+            cursor.execute(_LATEST_RESOLVED_PRICES_SQL)
+            for _market_id, resolution, bid_yes, ask_yes, last_yes in cursor:
+                p_mkt = mid_price(bid_yes, ask_yes, last_yes)
                 if p_mkt is None:
                     continue
                 idx = selector(p_mkt)
-                bucket = buckets[idx]
-                bucket["n"] += 1
-                if (market["resolution"] or "").upper() == "YES":
-                    bucket["n_yes"] += 1
-                bucket["p_mkt_sum"] += p_mkt
-
-    for bucket in buckets:
-        n = bucket["n"]
-        bucket["p_mkt_avg"] = (bucket["p_mkt_sum"] / n) if n else None
-        bucket["p_true"] = (bucket["n_yes"] / n) if n else None
+                n_arr[idx] += 1
+                if (resolution or "").upper() == "YES":
+                    n_yes_arr[idx] += 1
+                p_sum_arr[idx] += p_mkt
+
+    for idx, bucket in enumerate(buckets):
+        n = n_arr[idx]
+        bucket["n"] = n
+        bucket["n_yes"] = n_yes_arr[idx]
+        bucket["p_mkt_avg"] = (p_sum_arr[idx] / n) if n else None
+        bucket["p_true"] = (n_yes_arr[idx] / n) if n else None
         del bucket["p_mkt_sum"]
     return buckets
 
 
 def compute_calibration(num_bins: int = DEFAULT_BINS) -> List[Dict[str, Any]]:
     buckets = _bucket_edges(num_bins)
-    return _compute_calibration_generic(buckets, lambda p: _bucket_index(p, num_bins))
+    return _compute_calibration_generic(buckets, _make_uniform_selector(num_bins))
 
 
 def compute_calibration_with_bins(bin_edges: List[float]) -> List[Dict[str, Any]]:
@@ -140,23 +146,76 @@ def compute_calibration_with_bins(bin_edges: List[float]) -> List[Dict[str, Any]
 def _write_csv(buckets: List[Dict[str, Any]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = ["bucket_low", "bucket_high", "n", "n_yes", "p_mkt_avg", "p_true"]
-    with path.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(buckets)
+    with path.open("w", newline="", buffering=1024 * 1024) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (b["bucket_low"], b["bucket_high"], b["n"], b["n_yes"], b["p_mkt_avg"], b["p_true"])
+            for b in buckets
+        )
     LOGGER.info("Wrote calibration CSV to %s", path)
 
 
+def _svg_plot(points: List[tuple]) -> str:
+    """Render the calibration curve as a standalone SVG string."""
+
+    size, margin = 480, 40
+    span = size - 2 * margin
+
+    def sx(x: float) -> float:
+        return margin + x * span
+
+    def sy(y: float) -> float:
+        return size - margin - y * span
+
+    observed = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in points)
+    markers = "".join(
+        f'<circle cx="{sx(x):.1f}" cy="{sy(y):.1f}" r="3" fill="#1f77b4"/>' for x, y in points
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+        f'viewBox="0 0 {size} {size}">'
+        f'<rect width="{size}" height="{size}" fill="white"/>'
+        f'<line x1="{sx(0):.1f}" y1="{sy(0):.1f}" x2="{sx(1):.1f}" y2="{sy(1):.1f}" '
+        f'stroke="gray" stroke-dasharray="6,4"/>'
+        f'<polyline points="{observed}" fill="none" stroke="#1f77b4" stroke-width="1.5"/>'
+        f"{markers}"
+        f'<text x="{size / 2:.0f}" y="{size - 8}" text-anchor="middle" font-size="12">'
+        f"Market-implied probability</text>"
+        f'<text x="12" y="{size / 2:.0f}" text-anchor="middle" font-size="12" '
+        f'transform="rotate(-90 12 {size / 2:.0f})">Empirical YES frequency</text>'
+        f'<text x="{size / 2:.0f}" y="20" text-anchor="middle" font-size="14">'
+        f"Kalshi Calibration</text>"
+        f"</svg>"
+    )
+
+
 def _write_plot(buckets: List[Dict[str, Any]], path: Path) -> None:
+    points = [
+        (
+            bucket["bucket_low"] + (bucket["bucket_high"] - bucket["bucket_low"]) / 2,
+            bucket["p_true"] if bucket["p_true"] is not None else 0,
+        )
+        for bucket in buckets
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Default path: write the curve as SVG directly, skipping the several
+    # hundred milliseconds of matplotlib import on every CLI/cron run.
+    # matplotlib remains the fallback for raster output.
+    if path.suffix.lower() != ".png":
+        path.write_text(_svg_plot(points))
+        LOGGER.info("Wrote calibration plot to %s", path)
+        return
+
     try:
         import matplotlib.pyplot as plt
     except ImportError:  # pragma: no cover - optional dependency
-        LOGGER.warning("matplotlib not installed; skipping plot generation")
+        LOGGER.warning("matplotlib not installed; skipping PNG plot generation")
         return
 
-    xs = [bucket["bucket_low"] + (bucket["bucket_high"] - bucket["bucket_low"]) / 2 for bucket in buckets]
-    ys = [bucket["p_true"] if bucket["p_true"] is not None else 0 for bucket in buckets]
-
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
     plt.figure(figsize=(6, 6))
     plt.plot(xs, xs, linestyle="--", color="gray", label="Perfect calibration")
     plt.plot(xs, ys, marker="o", label="Observed")
@@ -164,7 +223,6 @@ def _write_plot(buckets: List[Dict[str, Any]], path: Path) -> None:
     plt.ylabel("Empirical YES frequency")
     plt.title("Kalshi Calibration")
     plt.legend()
-    path.parent.mkdir(parents=True, exist_ok=True)
     plt.savefig(path, bbox_inches="tight")
     plt.close()
     LOGGER.info("Wrote calibration plot to %s", path)
@@ -186,7 +244,12 @@ def main() -> None:
     parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help="Number of equal-width probability buckets")
     parser.add_argument("--extreme-bins", action="store_true", help="Use finer bins near 0 and 1")
     parser.add_argument("--csv", type=Path, default=OUT_DIR / "calibration.csv", help="Output CSV path")
-    parser.add_argument("--plot", type=Path, default=OUT_DIR / "calibration.png", help="Output PNG path")
+    parser.add_argument(
+        "--plot",
+        type=Path,
+        default=OUT_DIR / "calibration.svg",
+        help="Output plot path (.svg needs no extra deps; .png uses matplotlib)",
+    )
     args = parser.parse_args()
 
     if args.extreme_bins:
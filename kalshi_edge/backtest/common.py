@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
-
-from psycopg2.extras import RealDictCursor
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 MIN_OPEN_INTEREST = 10
 
@@ -18,10 +17,14 @@ class Trade:
     entry_timestamp: Any
 
 
-def compute_mid_price(row: Dict[str, Any]) -> Optional[float]:
-    bid = row.get("bid_yes")
-    ask = row.get("ask_yes")
-    last = row.get("last_yes")
+def mid_price(bid: Any, ask: Any, last: Any) -> Optional[float]:
+    """Mid of bid/ask when both are quoted, otherwise the last trade price.
+
+    Scalar form for hot loops that already have the three columns unpacked
+    (e.g. tuple rows), avoiding the per-row dict lookups of
+    ``compute_mid_price``.
+    """
+
     if bid is not None and ask is not None:
         return float(bid + ask) / 2.0
     if last is not None:
@@ -29,6 +32,10 @@ def compute_mid_price(row: Dict[str, Any]) -> Optional[float]:
     return None
 
 
+def compute_mid_price(row: Dict[str, Any]) -> Optional[float]:
+    return mid_price(row.get("bid_yes"), row.get("ask_yes"), row.get("last_yes"))
+
+
 def has_liquidity(row: Dict[str, Any], minimum_open_interest: int = MIN_OPEN_INTEREST) -> bool:
     open_interest = row.get("open_interest")
     if open_interest is None:
@@ -41,43 +48,29 @@ def compute_profit(resolution: str, entry_price: float) -> float:
     return (1.0 - entry_price) if is_yes else (-entry_price)
 
 
-def find_first_entry(
-    cursor: RealDictCursor,
-    market_id: str,
-    threshold: float,
-    comparator: Callable[[float, float], bool],
-) -> Optional[Trade]:
-    cursor.execute(
-        """
-        SELECT timestamp, bid_yes, ask_yes, last_yes, volume, open_interest
-        FROM prices
-        WHERE market_id = %s
-        ORDER BY timestamp ASC
-        """,
-        (market_id,),
-    )
-    for row in cursor.fetchall():
-        mid = compute_mid_price(row)
-        if mid is None or not has_liquidity(row):
-            continue
-        if comparator(mid, threshold):
-            return Trade(
-                market_id=market_id,
-                entry_price=mid,
-                resolution="",  # filled later
-                profit=0.0,
-                entry_timestamp=row["timestamp"],
-            )
-    return None
+def max_drawdown_from_profits(timed_profits: List[tuple]) -> float:
+    """Max drawdown over ``(entry_timestamp, profit)`` pairs.
 
+    The scan kernel works on plain tuples so hot sweeps that already hold
+    the pairs skip per-iteration attribute lookups on Trade objects.
+    """
 
-def max_drawdown(trades: List[Trade]) -> float:
+    if not timed_profits:
+        return 0.0
     equity = 0.0
     peak = 0.0
     max_dd = 0.0
-    for trade in sorted(trades, key=lambda t: t.entry_timestamp):
-        equity += trade.profit
-        peak = max(peak, equity)
-        drawdown = peak - equity
-        max_dd = max(max_dd, drawdown)
+    # Plain comparisons instead of max() calls keep the reduction loop free of
+    # per-iteration function dispatch. Sorting on the timestamp alone keeps
+    # the stable ordering the Trade-based path had for tied timestamps.
+    for _timestamp, profit in sorted(timed_profits, key=itemgetter(0)):
+        equity += profit
+        if equity > peak:
+            peak = equity
+        elif peak - equity > max_dd:
+            max_dd = peak - equity
     return max_dd
+
+
+def max_drawdown(trades: List[Trade]) -> float:
+    return max_drawdown_from_profits([(t.entry_timestamp, t.profit) for t in trades])
@@ -34,19 +34,38 @@ def _load_bins(csv_path: Path | None, num_bins: int) -> List[dict]:
     return compute_calibration(num_bins)
 
 
+# (source bins, computed midpoints) — holding the bins object keeps the
+# identity check safe, so repeated estimates over the same bin set skip the
+# rebuild-and-sort entirely.
+_midpoints_memo: Tuple[Sequence[dict], List[Tuple[float, float]]] | None = None
+
+
 def _bucket_midpoints(bins: Sequence[dict]) -> List[Tuple[float, float]]:
+    global _midpoints_memo
+    if _midpoints_memo is not None and _midpoints_memo[0] is bins:
+        return _midpoints_memo[1]
     points: List[Tuple[float, float]] = []
     for bucket in bins:
         if bucket["p_true"] is None:
             continue
         mid = bucket["bucket_low"] + (bucket["bucket_high"] - bucket["bucket_low"]) / 2
         points.append((mid, bucket["p_true"]))
-    return sorted(points, key=lambda item: item[0])
+    points.sort(key=lambda item: item[0])
+    _midpoints_memo = (bins, points)
+    return points
 
 
 def estimate_p_true(p_mkt: float, bins: Sequence[dict] | None = None) -> float:
-    bins_list = list(bins) if bins is not None else compute_calibration(DEFAULT_BINS)
-    points = _bucket_midpoints(bins_list)
+    """Interpolate the empirical probability for a market price.
+
+    ``bins`` is only read, never mutated or retained beyond the midpoint
+    memo, so any sequence can be passed without a defensive copy — which
+    also lets repeated calls with the same bins object hit the memo.
+    """
+
+    if bins is None:
+        bins = compute_calibration(DEFAULT_BINS)
+    points = _bucket_midpoints(bins)
     if not points:
         raise RuntimeError("Calibration bins missing p_true values; run calibration first")
 
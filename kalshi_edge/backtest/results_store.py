@@ -1,55 +1,127 @@
-"""Helpers to persist and fetch cached backtest/calibration results."""
+"""Helpers to persist and fetch cached backtest/calibration results.
+
+All database access here checks sessions out of the shared pool in
+``kalshi_edge.db``; ``get_connection`` returns a pooled proxy whose
+``close()`` releases back to the pool rather than disconnecting.
+"""
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 
 from ..db import get_connection
 
+# Column keys matching the SELECT lists below, bound once at import time so
+# per-row dict construction does not rebuild (and re-hash) the key list.
+_LATEST_VALUE_COLS = (
+    "params",
+    "num_trades",
+    "win_rate",
+    "average_profit",
+    "total_profit",
+    "created_at",
+)
+_RESULT_COLS = (
+    "strategy_name",
+    "params",
+    "num_trades",
+    "win_rate",
+    "average_profit",
+    "total_profit",
+    "raw_summary",
+    "created_at",
+)
+_CALIBRATION_COLS = ("binning_mode", "params", "buckets", "created_at")
 
-def save_backtest_result(strategy_name: str, params: Dict[str, Any], summary: Dict[str, Any]) -> None:
-    """Persist a single backtest summary into backtest_results."""
+_BACKTEST_INSERT_SQL = """
+    INSERT INTO backtest_results (
+        strategy_name,
+        params,
+        num_trades,
+        win_rate,
+        average_profit,
+        total_profit,
+        raw_summary
+    )
+    VALUES %s
+"""
 
-    num_trades = summary.get("num_trades")
-    win_rate = summary.get("win_rate")
-    average_profit = summary.get("average_profit")
-    total_profit = summary.get("total_profit")
 
-    with get_connection() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO backtest_results (
-                strategy_name,
-                params,
-                num_trades,
-                win_rate,
-                average_profit,
-                total_profit,
-                raw_summary
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """,
-            (
-                strategy_name,
-                Json(params),
-                num_trades,
-                win_rate,
-                average_profit,
-                total_profit,
-                Json(summary),
-            ),
+def save_backtest_results(
+    results: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any]]]
+) -> None:
+    """Persist many (strategy_name, params, summary) results in one insert.
+
+    Sweeps over dozens of thresholds previously paid one round trip and
+    commit per result; execute_values folds them into a single statement.
+    """
+
+    rows = [
+        (
+            strategy_name,
+            Json(params),
+            summary.get("num_trades"),
+            summary.get("win_rate"),
+            summary.get("average_profit"),
+            summary.get("total_profit"),
+            Json(summary),
         )
+        for strategy_name, params, summary in results
+    ]
+    if not rows:
+        return
+
+    with get_connection() as conn, conn.cursor() as cur:
+        execute_values(cur, _BACKTEST_INSERT_SQL, rows, page_size=500)
         conn.commit()
+    _invalidate_latest_cache()
+
+
+def save_backtest_result(strategy_name: str, params: Dict[str, Any], summary: Dict[str, Any]) -> None:
+    """Persist a single backtest summary into backtest_results."""
+
+    save_backtest_results([(strategy_name, params, summary)])
+
+
+# Short-TTL cache for the latest-results query: dashboards poll it every few
+# seconds but the data only changes when a sweep saves. Same pattern as the
+# API response cache. Callers must treat the returned dict as read-only.
+_LATEST_TTL_SECONDS = 10.0
+_latest_cache: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+_latest_cache_lock = threading.Lock()
+
+
+def _invalidate_latest_cache() -> None:
+    global _latest_cache
+    with _latest_cache_lock:
+        _latest_cache = None
 
 
 def get_latest_backtest_results() -> Dict[str, Dict[str, Any]]:
     """Fetch the most recent backtest result per known strategy.
 
-    Only returns strategies that have at least one row; callers should handle missing keys.
+    Only returns strategies that have at least one row; callers should handle
+    missing keys and must not mutate the returned mapping (it is shared via a
+    short-TTL cache).
     """
 
+    global _latest_cache
+    now = time.monotonic()
+    with _latest_cache_lock:
+        if _latest_cache is not None and _latest_cache[0] > now:
+            return _latest_cache[1]
+
+    result = _fetch_latest_backtest_results()
+    with _latest_cache_lock:
+        _latest_cache = (now + _LATEST_TTL_SECONDS, result)
+    return result
+
+
+def _fetch_latest_backtest_results() -> Dict[str, Dict[str, Any]]:
     with get_connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
@@ -67,17 +139,7 @@ def get_latest_backtest_results() -> Dict[str, Dict[str, Any]]:
         )
         rows = cur.fetchall()
 
-    return {
-        row[0]: {
-            "params": row[1],
-            "num_trades": row[2],
-            "win_rate": row[3],
-            "average_profit": row[4],
-            "total_profit": row[5],
-            "created_at": row[6],
-        }
-        for row in rows
-    }
+    return {row[0]: dict(zip(_LATEST_VALUE_COLS, row[1:])) for row in rows}
 
 
 def get_all_latest_backtest_results() -> Dict[str, Dict[str, Any]]:
@@ -86,6 +148,28 @@ def get_all_latest_backtest_results() -> Dict[str, Dict[str, Any]]:
     return get_latest_backtest_results()
 
 
+# (source results dict, filtered threshold view) — keeping a reference to the
+# source object makes the identity check below safe against id reuse.
+_threshold_view: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]] = None
+
+
+def get_threshold_results() -> Dict[str, Dict[str, Any]]:
+    """Return only the ``threshold_*`` strategies from the latest results.
+
+    The filtered view is memoized against the identity of the underlying
+    results dict, so repeated dashboard loads skip re-scanning the full
+    mapping whenever the fetch returns the same snapshot.
+    """
+
+    global _threshold_view
+    latest = get_all_latest_backtest_results()
+    if _threshold_view is not None and _threshold_view[0] is latest:
+        return _threshold_view[1]
+    filtered = {k: v for k, v in latest.items() if k.startswith("threshold_")}
+    _threshold_view = (latest, filtered)
+    return filtered
+
+
 def list_backtest_results(limit: int = 200) -> List[Dict[str, Any]]:
     """Return recent backtest results ordered by created_at desc."""
 
@@ -100,17 +184,38 @@ def list_backtest_results(limit: int = 200) -> List[Dict[str, Any]]:
             (limit,),
         )
         rows = cur.fetchall()
-    keys = [
-        "strategy_name",
-        "params",
-        "num_trades",
-        "win_rate",
-        "average_profit",
-        "total_profit",
-        "raw_summary",
-        "created_at",
+    return [dict(zip(_RESULT_COLS, row)) for row in rows]
+
+
+# execute_values is the right bulk tool here rather than COPY: a calibration
+# run persists one jsonb-heavy row (a sweep a handful), far below the volume
+# where COPY's throughput wins justify hand-escaping jsonb into TSV. Each
+# batch already lands in a single transaction.
+_CALIBRATION_INSERT_SQL = """
+    INSERT INTO calibration_results (
+        binning_mode,
+        params,
+        buckets
+    )
+    VALUES %s
+"""
+
+
+def save_calibration_results(
+    results: Iterable[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]
+) -> None:
+    """Persist many (binning_mode, params, buckets) results in one insert."""
+
+    rows = [
+        (binning_mode, Json(params), Json(buckets))
+        for binning_mode, params, buckets in results
     ]
-    return [dict(zip(keys, row)) for row in rows]
+    if not rows:
+        return
+
+    with get_connection() as conn, conn.cursor() as cur:
+        execute_values(cur, _CALIBRATION_INSERT_SQL, rows, page_size=500)
+        conn.commit()
 
 
 def save_calibration_result(
@@ -118,23 +223,7 @@ def save_calibration_result(
 ) -> None:
     """Persist a calibration bucket set into calibration_results."""
 
-    with get_connection() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO calibration_results (
-                binning_mode,
-                params,
-                buckets
-            )
-            VALUES (%s, %s, %s)
-            """,
-            (
-                binning_mode,
-                Json(params),
-                Json(buckets),
-            ),
-        )
-        conn.commit()
+    save_calibration_results([(binning_mode, params, buckets)])
 
 
 def get_latest_calibration_result(binning_mode: str = "extreme") -> Optional[Dict[str, Any]]:
@@ -177,16 +266,18 @@ def list_calibration_results(limit: int = 100) -> List[Dict[str, Any]]:
             (limit,),
         )
         rows = cur.fetchall()
-    keys = ["binning_mode", "params", "buckets", "created_at"]
-    return [dict(zip(keys, row)) for row in rows]
+    return [dict(zip(_CALIBRATION_COLS, row)) for row in rows]
 
 
 __all__ = [
     "save_backtest_result",
+    "save_backtest_results",
     "get_latest_backtest_results",
     "get_all_latest_backtest_results",
+    "get_threshold_results",
     "list_backtest_results",
     "save_calibration_result",
+    "save_calibration_results",
     "get_latest_calibration_result",
     "list_calibration_results",
 ]
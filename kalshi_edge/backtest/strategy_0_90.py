@@ -10,12 +10,11 @@ connection_ctx = _connection_ctx
 
 """Backtest the "buy at 0.90 YES" strategy."""
 import argparse
-import csv
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from ..util.logging import get_logger
-from .strategy_threshold import run_threshold_backtest
+from .strategy_threshold import print_summary, run_threshold_backtest, write_trades_csv
 from . import strategy_threshold as _threshold_mod
 
 LOGGER = get_logger(__name__)
@@ -29,33 +28,6 @@ def run_backtest(threshold: float = DEFAULT_THRESHOLD) -> Tuple[Dict[str, Any],
     return run_threshold_backtest(threshold=threshold, direction="yes")
 
 
-def _print_summary(summary: Dict[str, Any]) -> None:
-    LOGGER.info("Executed %d trades", summary["num_trades"])
-    print(
-        "\n".join(
-            [
-                f"Threshold: {summary['threshold']:.2f}",
-                f"Trades: {summary['num_trades']}",
-                f"Win rate: {summary['win_rate'] * 100:.2f}%",
-                f"Average entry: {summary['average_entry_price']:.4f}",
-                f"Average profit: {summary['average_profit']:.4f}",
-                f"Total profit: {summary['total_profit']:.4f}",
-                f"Max drawdown: {summary['max_drawdown']:.4f}",
-            ]
-        )
-    )
-
-
-def _write_trades_csv(path: Path, trades: List[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["market_id", "entry_timestamp", "entry_price", "resolution", "profit"]
-    with path.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(trades)
-    LOGGER.info("Wrote %d trades to %s", len(trades), path)
-
-
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the 0.90 YES backtest")
     parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
@@ -66,6 +38,6 @@ def _parse_args() -> argparse.Namespace:
 if __name__ == "__main__":
     args = _parse_args()
     summary, trades = run_backtest(args.threshold)
-    _print_summary(summary)
+    print_summary(summary)
     if args.csv_path:
-        _write_trades_csv(args.csv_path, trades)
+        write_trades_csv(args.csv_path, trades)
@@ -1,9 +1,14 @@
 """Generic threshold-based backtest engine."""
 from __future__ import annotations
 
+import csv
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Tuple, Iterable
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Iterable
+
+import orjson
 
 SPORT_TICKER_HINTS = (
     "NFL",
@@ -23,38 +28,81 @@ from psycopg2.extras import RealDictCursor
 
 from ..db import connection_ctx
 from ..util.logging import get_logger
-from .common import Trade, compute_profit, find_first_entry, max_drawdown
+from .common import MIN_OPEN_INTEREST, Trade, max_drawdown_from_profits, mid_price
 
 LOGGER = get_logger(__name__)
 
+# Per-direction constants bound once at import time; sweeps call
+# run_threshold_backtest thousands of times and a dict probe doubles as the
+# membership validation.
+_DIRECTION_COMPARATORS = {"yes": operator.ge, "no": operator.le}
+_DIRECTION_WIN_RES = {"yes": "YES", "no": "NO"}
 
-def _directional_profit(direction: str, resolution: str, yes_entry_price: float) -> float:
-    """Compute profit depending on whether we bought YES or NO."""
 
-    direction = direction.lower()
-    if direction == "yes":
-        return compute_profit(resolution, yes_entry_price)
+def _build_markets_query(
+    category: str | None,
+    expiry_bucket: str | None,
+    cutoff: datetime | None,
+    allowed_cat_set: set[str] | None,
+    now: datetime,
+) -> Tuple[str, List[Any]]:
+    """Assemble the resolved-markets SELECT with all filters in the WHERE.
+
+    Category, allowed-category/ticker-hint, history cutoff, and expiry bucket
+    used to be applied row by row in Python; pushing them into SQL returns
+    only the surviving markets.
+    """
 
-    # Buying NO: price paid is (1 - yes_price); payout is 1 if NO resolves.
-    no_price = 1.0 - yes_entry_price
-    is_yes = (resolution or "").upper() == "YES"
-    return -no_price if is_yes else (1.0 - no_price)
+    where = ["resolution IS NOT NULL"]
+    params: List[Any] = []
 
+    if category:
+        where.append("LOWER(COALESCE(category, '')) = %s")
+        params.append(category.lower())
 
-def _expiry_bucket_predicate(expiration_ts: Any, bucket: str | None) -> bool:
-    if bucket is None:
-        return True
-    if expiration_ts is None:
-        return False
-    now = datetime.now(timezone.utc)
-    delta = expiration_ts - now
-    if bucket == "short":
-        return delta <= timedelta(days=1)
-    if bucket == "medium":
-        return timedelta(days=1) < delta <= timedelta(days=7)
-    if bucket == "long":
-        return delta > timedelta(days=7)
-    return True
+    if allowed_cat_set is not None:
+        where.append(
+            "(LOWER(COALESCE(category, '')) = ANY(%s) OR UPPER(market_id) LIKE ANY(%s))"
+        )
+        params.append(sorted(allowed_cat_set))
+        params.append([f"%{hint}%" for hint in SPORT_TICKER_HINTS])
+
+    if cutoff:
+        where.append("(expiration_ts IS NULL OR expiration_ts >= %s)")
+        params.append(cutoff)
+
+    if expiry_bucket == "short":
+        where.append("expiration_ts IS NOT NULL AND expiration_ts <= %s")
+        params.append(now + timedelta(days=1))
+    elif expiry_bucket == "medium":
+        where.append("expiration_ts IS NOT NULL AND expiration_ts > %s AND expiration_ts <= %s")
+        params.append(now + timedelta(days=1))
+        params.append(now + timedelta(days=7))
+    elif expiry_bucket == "long":
+        where.append("expiration_ts IS NOT NULL AND expiration_ts > %s")
+        params.append(now + timedelta(days=7))
+
+    # UPPER once in SQL so the per-trade comparisons below work on already
+    # normalized resolution strings.
+    sql = "SELECT market_id, UPPER(resolution) AS resolution\nFROM markets\nWHERE " + "\n  AND ".join(where)
+    return sql, params
+
+
+# Earliest qualifying price row for every market in the sweep, in one
+# statement. DISTINCT ON ordered by timestamp replaces the old LIMIT 1 query
+# per market, collapsing M round trips into one. The COALESCE mirrors
+# mid_price: mid of bid/ask when both are present, otherwise last_yes. The
+# float8 casts hand Python floats straight to the arithmetic below instead of
+# a Decimal per NUMERIC cell.
+_FIRST_ENTRIES_SQL = """
+    SELECT DISTINCT ON (market_id)
+        market_id, timestamp, bid_yes::float8, ask_yes::float8, last_yes::float8
+    FROM prices
+    WHERE market_id = ANY(%s)
+      AND COALESCE((bid_yes + ask_yes) / 2.0, last_yes) {op} %s
+      AND (open_interest IS NULL OR open_interest >= %s)
+    ORDER BY market_id, timestamp ASC
+"""
 
 
 def run_threshold_backtest(
@@ -65,69 +113,95 @@ def run_threshold_backtest(
     *,
     since_hours: float | None = None,
     allowed_categories: Iterable[str] | None = None,
+    entry_comparator: Callable[[float, float], bool] | None = None,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     """
     Backtest a simple threshold rule.
 
     direction = "yes": buy YES when yes_price >= threshold.
     direction = "no":  buy NO  when yes_price <= threshold.
+
+    ``entry_comparator`` overrides the entry condition implied by the
+    direction, e.g. buying YES when the price is *below* the threshold.
     """
 
     direction = direction.lower()
-    if direction not in ("yes", "no"):
+    default_comparator = _DIRECTION_COMPARATORS.get(direction)
+    if default_comparator is None:
         raise ValueError("direction must be 'yes' or 'no'")
 
-    comparator = operator.ge if direction == "yes" else operator.le
+    comparator = entry_comparator or default_comparator
     trades: List[Trade] = []
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=since_hours) if since_hours else None
     allowed_cat_set = {c.lower() for c in allowed_categories} if allowed_categories else None
 
-    with connection_ctx() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                SELECT market_id, resolution, category, expiration_ts
-                FROM markets
-                WHERE resolution IS NOT NULL
-                """
-            )
-            markets = cursor.fetchall()
-            for market in markets:
-                cat_val = (market.get("category") or "").lower()
-                ticker_upper = str(market.get("market_id") or "").upper()
-
-                if category and cat_val != category.lower():
-                    continue
-                if allowed_cat_set is not None:
-                    if cat_val in allowed_cat_set:
-                        pass
-                    elif any(hint in ticker_upper for hint in SPORT_TICKER_HINTS):
-                        pass
-                    else:
-                        continue
+    # Hoist loop invariants: the inner loop runs once per surviving market.
+    is_yes_direction = direction == "yes"
+    append_trade = trades.append
 
-                if cutoff and market.get("expiration_ts") and market["expiration_ts"] < cutoff:
-                    continue
-                if not _expiry_bucket_predicate(market.get("expiration_ts"), expiry_bucket):
-                    continue
-                entry = find_first_entry(cursor, market["market_id"], threshold, comparator)
-                if not entry:
-                    continue
+    # Summary statistics accumulate in the same pass that builds the trades,
+    # instead of re-scanning the list once per aggregate afterwards.
+    win_res = _DIRECTION_WIN_RES[direction]
+    total_profit = 0.0
+    entry_price_sum = 0.0
+    wins = 0
+    # (entry_timestamp, profit) pairs feed the drawdown scan directly,
+    # sparing it a pass re-reading the Trade objects.
+    timed_profits: List[tuple] = []
 
-                # entry.entry_price holds the YES price; adjust if buying NO.
-                yes_price = entry.entry_price
-                entry_price_for_record = yes_price if direction == "yes" else (1.0 - yes_price)
+    markets_sql, markets_params = _build_markets_query(
+        category, expiry_bucket, cutoff, allowed_cat_set, now
+    )
 
-                entry.resolution = market["resolution"] or "UNKNOWN"
-                entry.profit = _directional_profit(direction, entry.resolution, yes_price)
-                entry.entry_price = entry_price_for_record
-                trades.append(entry)
+    with connection_ctx() as conn:
+        # Markets stream through a server-side named cursor in itersize
+        # chunks, so large catalogs never materialize client-side beyond the
+        # resolutions map; entries come back from one batched DISTINCT ON
+        # query over a plain tuple cursor instead of a round trip per market.
+        with conn.cursor(
+            name="markets_stream", cursor_factory=RealDictCursor
+        ) as cursor, conn.cursor() as entry_cursor:
+            cursor.itersize = 2000
+            cursor.execute(markets_sql, markets_params)
+            resolutions = {m["market_id"]: m["resolution"] for m in cursor}
+            if resolutions:
+                # Probing the comparator picks the SQL operator without
+                # assuming which callable was passed in.
+                op = ">=" if comparator(1.0, 0.0) else "<="
+                entry_cursor.execute(
+                    _FIRST_ENTRIES_SQL.format(op=op),
+                    (list(resolutions), threshold, MIN_OPEN_INTEREST),
+                )
+                for market_id, entry_ts, bid_yes, ask_yes, last_yes in entry_cursor.fetchall():
+                    yes_price = mid_price(bid_yes, ask_yes, last_yes)
+                    if yes_price is None:
+                        continue
+                    resolution = resolutions[market_id] or "UNKNOWN"
+                    # Payout is 1 when the bought side resolves, 0 otherwise,
+                    # minus the price paid — which reduces to plain arithmetic
+                    # on the already-uppercased resolution, no per-trade
+                    # direction branching or string normalization.
+                    is_yes = resolution == "YES"
+                    profit = (is_yes - yes_price) if is_yes_direction else (yes_price - is_yes)
+                    # Trade records the price actually paid; adjust if buying NO.
+                    entry_price = yes_price if is_yes_direction else (1.0 - yes_price)
+                    total_profit += profit
+                    entry_price_sum += entry_price
+                    if resolution == win_res:
+                        wins += 1
+                    timed_profits.append((entry_ts, profit))
+                    append_trade(
+                        Trade(
+                            market_id=market_id,
+                            entry_price=entry_price,
+                            resolution=resolution,
+                            profit=profit,
+                            entry_timestamp=entry_ts,
+                        )
+                    )
 
     num_trades = len(trades)
-    total_profit = sum(t.profit for t in trades)
-    win_res = "YES" if direction == "yes" else "NO"
-    wins = sum(1 for t in trades if (t.resolution or "").upper() == win_res)
 
     summary = {
         "threshold": threshold,
@@ -136,27 +210,118 @@ def run_threshold_backtest(
         "expiry_bucket": expiry_bucket,
         "num_trades": num_trades,
         "win_rate": (wins / num_trades) if num_trades else 0.0,
-        "average_entry_price": (sum(t.entry_price for t in trades) / num_trades) if num_trades else 0.0,
+        "average_entry_price": (entry_price_sum / num_trades) if num_trades else 0.0,
         "average_profit": (total_profit / num_trades) if num_trades else 0.0,
         "total_profit": total_profit,
-        "max_drawdown": max_drawdown(trades),
+        "max_drawdown": max_drawdown_from_profits(timed_profits),
     }
 
-    trade_dicts = [
-        {
-            "market_id": t.market_id,
-            "entry_timestamp": t.entry_timestamp.isoformat()
-            if hasattr(t.entry_timestamp, "isoformat")
-            else t.entry_timestamp,
-            "entry_price": t.entry_price,
-            "resolution": t.resolution,
-            "profit": t.profit,
-            "direction": direction,
-            "threshold": threshold,
-        }
-        for t in trades
-    ]
+    trade_dicts = [_trade_dict(t, direction, threshold) for t in trades]
     return summary, trade_dicts
 
 
-__all__ = ["run_threshold_backtest"]
+def _trade_dict(trade: Trade, direction: str, threshold: float) -> Dict[str, Any]:
+    # psycopg2 always hands back datetime (or NULL -> None) for the timestamp
+    # column, so call isoformat directly instead of probing with hasattr.
+    timestamp = trade.entry_timestamp
+    return {
+        "market_id": trade.market_id,
+        "entry_timestamp": timestamp.isoformat() if timestamp is not None else None,
+        "entry_price": trade.entry_price,
+        "resolution": trade.resolution,
+        "profit": trade.profit,
+        "direction": direction,
+        "threshold": threshold,
+    }
+
+
+def stream_trades_ndjson(
+    trades: Iterable[Trade], direction: str, threshold: float
+) -> Iterator[bytes]:
+    """Yield trades as NDJSON lines without materializing the dict list.
+
+    Mirrors the API's streaming endpoints: one orjson-encoded line per
+    trade, so serializing a large backtest keeps memory at one row."""
+
+    for trade in trades:
+        yield orjson.dumps(_trade_dict(trade, direction, threshold), default=str) + b"\n"
+
+
+def run_threshold_sweep(
+    jobs: List[Tuple[float, str]],
+    *,
+    category: str | None = None,
+    expiry_bucket: str | None = None,
+    since_hours: float | None = None,
+    allowed_categories: Iterable[str] | None = None,
+    max_workers: int = 4,
+) -> List[Tuple[float, str, Dict[str, Any]]]:
+    """Run many (threshold, direction) backtests concurrently.
+
+    Each backtest is dominated by its two server-side queries, so a few
+    threads checking distinct sessions out of the shared pool overlap the
+    database work. Returns ``(threshold, direction, summary)`` tuples in job
+    order; trade lists are dropped, as sweeps only persist summaries.
+    """
+
+    allowed = tuple(allowed_categories) if allowed_categories is not None else None
+
+    def _run_one(job: Tuple[float, str]) -> Tuple[float, str, Dict[str, Any]]:
+        threshold, direction = job
+        summary, _ = run_threshold_backtest(
+            threshold=threshold,
+            direction=direction,
+            category=category,
+            expiry_bucket=expiry_bucket,
+            since_hours=since_hours,
+            allowed_categories=allowed,
+        )
+        return threshold, direction, summary
+
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        return list(pool.map(_run_one, jobs))
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """CLI report shared by the named strategy entry points."""
+
+    LOGGER.info("Executed %d trades", summary["num_trades"])
+    print(
+        "\n".join(
+            [
+                f"Threshold: {summary['threshold']:.2f}",
+                f"Trades: {summary['num_trades']}",
+                f"Win rate: {summary['win_rate'] * 100:.2f}%",
+                f"Average entry: {summary['average_entry_price']:.4f}",
+                f"Average profit: {summary['average_profit']:.4f}",
+                f"Total profit: {summary['total_profit']:.4f}",
+                f"Max drawdown: {summary['max_drawdown']:.4f}",
+            ]
+        )
+    )
+
+
+def write_trades_csv(path: Path, trades: List[Dict[str, Any]]) -> None:
+    """Dump trade dicts to CSV, shared by the named strategy entry points."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fieldnames = ["market_id", "entry_timestamp", "entry_price", "resolution", "profit"]
+    with path.open("w", newline="", buffering=1024 * 1024) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (t["market_id"], t["entry_timestamp"], t["entry_price"], t["resolution"], t["profit"])
+            for t in trades
+        )
+    LOGGER.info("Wrote %d trades to %s", len(trades), path)
+
+
+__all__ = [
+    "run_threshold_backtest",
+    "run_threshold_sweep",
+    "stream_trades_ndjson",
+    "print_summary",
+    "write_trades_csv",
+]
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import os
+import time
 from typing import Literal, Optional, Tuple
 
 ExecutionMode = Literal["simulate", "live"]
@@ -66,6 +68,7 @@ def load_settings(force_reload: bool = False) -> Settings:
     return _cached_settings
 
 
+@lru_cache(maxsize=None)
 def get_kalshi_env() -> str:
     """Return Kalshi environment string (`demo` or `live`)."""
 
@@ -77,6 +80,7 @@ def get_kalshi_env() -> str:
     return env_raw
 
 
+@lru_cache(maxsize=None)
 def get_kalshi_creds() -> Tuple[str, str]:
     """Fetch Kalshi API key id and secret (secret is the private key path)."""
 
@@ -87,6 +91,7 @@ def get_kalshi_creds() -> Tuple[str, str]:
     return api_key_id, api_key_secret
 
 
+@lru_cache(maxsize=None)
 def get_execution_mode() -> ExecutionMode:
     """Return execution mode; default to simulate for safety."""
 
@@ -96,27 +101,47 @@ def get_execution_mode() -> ExecutionMode:
     return mode  # type: ignore[return-value]
 
 
+def _get_float_env(name: str, default: float) -> float:
+    val = os.getenv(name)
+    if not val:
+        return default
+    try:
+        return float(val)
+    except ValueError:
+        return default
+
+
+@lru_cache(maxsize=None)
+def _load_risk_limits() -> Tuple[float, float, float]:
+    return (
+        _get_float_env("MAX_RISK_PER_TRADE_USD", 10.0),
+        _get_float_env("MAX_RISK_PER_MARKET_USD", 50.0),
+        _get_float_env("MAX_RISK_TOTAL_USD", 200.0),
+    )
+
+
 def get_risk_limits() -> dict:
-    """Load simple USD risk caps for execution."""
+    """Load simple USD risk caps for execution.
 
-    def _get_float(name: str, default: float) -> float:
-        val = os.getenv(name)
-        if not val:
-            return default
-        try:
-            return float(val)
-        except ValueError:
-            return default
+    Parsed once per process; each call still gets a fresh dict so callers
+    can mutate their copy without poisoning the cache.
+    """
 
+    per_trade, per_market, total = _load_risk_limits()
     return {
-        "max_risk_per_trade": _get_float("MAX_RISK_PER_TRADE_USD", 10.0),
-        "max_risk_per_market": _get_float("MAX_RISK_PER_MARKET_USD", 50.0),
-        "max_risk_total": _get_float("MAX_RISK_TOTAL_USD", 200.0),
+        "max_risk_per_trade": per_trade,
+        "max_risk_per_market": per_market,
+        "max_risk_total": total,
     }
 
 
+@lru_cache(maxsize=None)
 def get_initial_bankroll_usd() -> float:
-    """Configured starting capital used when no account snapshot is available."""
+    """Configured starting capital used when no account snapshot is available.
+
+    Memoized: per-order risk checks call this repeatedly and the env var
+    never changes within a process.
+    """
 
     try:
         return float(os.getenv("INITIAL_BANKROLL_USD", "1000.0"))
@@ -124,8 +149,13 @@ def get_initial_bankroll_usd() -> float:
         return 1000.0
 
 
+@lru_cache(maxsize=None)
 def get_max_risk_fraction_per_trade() -> float:
-    """Maximum fraction of bankroll to risk on a single trade (e.g., 0.03 = 3%)."""
+    """Maximum fraction of bankroll to risk on a single trade (e.g., 0.03 = 3%).
+
+    Memoized like ``get_initial_bankroll_usd``; the getenv + float parse only
+    happens once per process.
+    """
 
     try:
         # Default to a conservative 1.5% until we have better signal confidence.
@@ -134,6 +164,7 @@ def get_max_risk_fraction_per_trade() -> float:
         return 0.015
 
 
+@lru_cache(maxsize=None)
 def get_take_profit_factor() -> float:
     """Multiple of entry price required to trigger take-profit exits."""
 
@@ -143,6 +174,7 @@ def get_take_profit_factor() -> float:
         return 4.0
 
 
+@lru_cache(maxsize=None)
 def get_pro_longshot_take_profit_factor() -> float:
     """Take-profit factor specifically for pro long-shot entries (default 2.2x)."""
 
@@ -152,28 +184,68 @@ def get_pro_longshot_take_profit_factor() -> float:
         return 2.2
 
 
+def _reset_config_cache() -> None:
+    """Clear memoized env reads, for tests that monkeypatch the environment."""
+
+    global _cached_settings
+    _cached_settings = None
+    get_kalshi_env.cache_clear()
+    get_kalshi_creds.cache_clear()
+    get_execution_mode.cache_clear()
+    _load_risk_limits.cache_clear()
+    get_initial_bankroll_usd.cache_clear()
+    get_max_risk_fraction_per_trade.cache_clear()
+    get_take_profit_factor.cache_clear()
+    get_pro_longshot_take_profit_factor.cache_clear()
+    invalidate_bankroll_cache()
+
+
+# Bankroll changes only when PnL is written, so a short TTL cache spares the
+# scheduler's tight execution loop a query per batch. Writers invalidate
+# explicitly; the TTL bounds staleness for out-of-process updates.
+_BANKROLL_CACHE_TTL_SECONDS = 30.0
+_bankroll_cache_value: Optional[float] = None
+_bankroll_cache_at: float = 0.0
+
+
+def invalidate_bankroll_cache() -> None:
+    """Drop the cached bankroll (call after writing trades or PnL snapshots)."""
+
+    global _bankroll_cache_value
+    _bankroll_cache_value = None
+
+
 def get_current_bankroll_usd(conn) -> float:
     """
     Return current bankroll/equity.
     - If account_pnl exists and has rows, use the latest total_equity.
     - Otherwise, fall back to INITIAL_BANKROLL_USD.
+    Cached in-process for a short TTL; see invalidate_bankroll_cache.
     """
 
+    global _bankroll_cache_value, _bankroll_cache_at
+    now = time.monotonic()
+    if _bankroll_cache_value is not None and now - _bankroll_cache_at < _BANKROLL_CACHE_TTL_SECONDS:
+        return _bankroll_cache_value
+
     initial = get_initial_bankroll_usd()
+    value = initial
     try:
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT total_equity FROM account_pnl ORDER BY as_of_date DESC LIMIT 1;"
             )
             row = cur.fetchone()
-        if row is None:
-            return initial
-        val = float(row[0])
-        if val <= 0:
-            return initial
-        return val
+        if row is not None:
+            val = float(row[0])
+            if val > 0:
+                value = val
     except Exception:
-        return initial
+        pass
+
+    _bankroll_cache_value = value
+    _bankroll_cache_at = now
+    return value
 
 
 __all__ = [
@@ -189,4 +261,5 @@ __all__ = [
     "get_max_risk_fraction_per_trade",
     "get_take_profit_factor",
     "get_current_bankroll_usd",
+    "invalidate_bankroll_cache",
 ]
@@ -1,30 +1,170 @@
 """Database connection utilities and migration runner."""
 from __future__ import annotations
 
+import atexit
 import contextlib
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Iterator, List
+from typing import Any, Iterator, List, Optional
 
 import psycopg2
 from psycopg2.extensions import connection as PGConnection
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 from .config import load_settings
 
 LOGGER = logging.getLogger(__name__)
 MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
 
+# Pool bounds: keep a few warm connections around and cap total sessions so a
+# burst of dashboard requests cannot exhaust Postgres connection slots. The
+# cap is overridable so deployments sharing a Postgres can budget their slots;
+# the default matches FastAPI's sync-endpoint threadpool (40 workers) so every
+# request thread can hold a session without hitting the cap.
+POOL_MIN_CONNECTIONS = 4
+POOL_MAX_CONNECTIONS = int(os.getenv("PG_POOL_MAX", "40"))
+# How long a checkout may wait for a free session before giving up.
+POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("PG_POOL_ACQUIRE_TIMEOUT", "10"))
+
+_pool: Optional[ThreadedConnectionPool] = None
+# getconn() raises PoolError immediately when the pool is exhausted; this
+# semaphore (sized to the pool cap) makes checkouts queue for a free session
+# instead, so bursts above the cap wait rather than turning into HTTP 500s.
+_pool_slots: Optional[threading.Semaphore] = None
+_pool_lock = threading.Lock()
+
+
+class _TrackingConnection(PGConnection):
+    """Pooled connection that remembers which statements it has PREPAREd.
+
+    Server-side prepared statements live for the session, and pooled sessions
+    are long-lived; hot-path callers consult ``prepared_statements`` to PREPARE
+    once per session and EXECUTE thereafter, skipping the per-call parse/plan.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: set = set()
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Return the shared pool, creating it lazily on first use."""
+
+    global _pool, _pool_slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                settings = load_settings()
+                _pool_slots = threading.Semaphore(POOL_MAX_CONNECTIONS)
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS,
+                    POOL_MAX_CONNECTIONS,
+                    dsn=settings.database_url,
+                    connection_factory=_TrackingConnection,
+                )
+                LOGGER.info(
+                    "Initialized connection pool (min=%d, max=%d)",
+                    POOL_MIN_CONNECTIONS,
+                    POOL_MAX_CONNECTIONS,
+                )
+    return _pool
+
+
+class PooledConnection:
+    """Proxy around a pooled psycopg2 connection.
+
+    ``close()`` returns the session to the pool instead of tearing it down, so
+    existing call sites keep their open/close semantics while avoiding the
+    TCP+TLS+auth handshake on every request. ``with conn:`` keeps psycopg2's
+    commit/rollback behaviour and releases the connection on exit.
+    """
+
+    __slots__ = ("_conn", "_released", "_slot")
+
+    def __init__(self, conn: PGConnection, slot: Optional[threading.Semaphore] = None) -> None:
+        self._conn = conn
+        self._released = False
+        self._slot = slot
+
+    def close(self) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        try:
+            _get_pool().putconn(self._conn, close=self._conn.closed != 0)
+        finally:
+            if self._slot is not None:
+                self._slot.release()
+
+    def __enter__(self) -> "PooledConnection":
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> Any:
+        try:
+            return self._conn.__exit__(exc_type, exc, tb)
+        finally:
+            self._release()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+def get_connection() -> PooledConnection:
+    """Check a connection out of the shared pool.
+
+    Blocks (up to ``POOL_ACQUIRE_TIMEOUT_SECONDS``) for a free session when
+    the pool is fully checked out rather than failing immediately. Callers
+    must ``close()`` it (or use it as a context manager) to return the
+    session to the pool.
+    """
+
+    pool = _get_pool()
+    slot = _pool_slots
+    if slot is not None and not slot.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS):
+        raise PoolError(
+            f"connection pool exhausted; no session freed within "
+            f"{POOL_ACQUIRE_TIMEOUT_SECONDS:g}s"
+        )
+    try:
+        return PooledConnection(pool.getconn(), slot)
+    except Exception:
+        if slot is not None:
+            slot.release()
+        raise
+
+
+def open_pool() -> None:
+    """Eagerly initialize the shared pool (e.g. as a FastAPI startup hook)."""
+
+    _get_pool()
 
-def get_connection() -> PGConnection:
-    """Create a new psycopg2 connection using the configured DATABASE_URL."""
 
-    settings = load_settings()
-    return psycopg2.connect(settings.database_url)
+def close_pool() -> None:
+    """Tear down all pooled connections (e.g. as a FastAPI shutdown hook)."""
+
+    global _pool, _pool_slots
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+            _pool_slots = None
+
+
+# Short-lived scripts (backtests, one-off CLIs) never run the FastAPI
+# shutdown hook, so make sure pooled sessions close cleanly on interpreter
+# exit as well. A no-op if the pool was never created or already closed.
+atexit.register(close_pool)
 
 
 @contextlib.contextmanager
-def connection_ctx() -> Iterator[PGConnection]:
-    """Context manager that yields a PostgreSQL connection."""
+def connection_ctx() -> Iterator[PooledConnection]:
+    """Context manager that yields a pooled PostgreSQL connection."""
 
     conn = get_connection()
     try:
@@ -33,6 +173,25 @@ def connection_ctx() -> Iterator[PGConnection]:
         conn.close()
 
 
+@contextlib.contextmanager
+def borrowed_connection(conn: Optional[PooledConnection] = None) -> Iterator[PooledConnection]:
+    """Yield ``conn`` if provided, else check one out of the pool for the block.
+
+    Helpers that take an optional connection wrap their database access in
+    this, so multi-query workflows can fan out over a single pooled session
+    while one-shot callers keep working unchanged.
+    """
+
+    if conn is not None:
+        yield conn
+        return
+    owned = get_connection()
+    try:
+        yield owned
+    finally:
+        owned.close()
+
+
 def _load_migration_files() -> List[Path]:
     return sorted(MIGRATIONS_DIR.glob("*.sql"))
 
@@ -45,13 +204,25 @@ def run_migrations() -> None:
         LOGGER.info("No migration files found in %s", MIGRATIONS_DIR)
         return
 
+    # The files are idempotent DDL (no parameterized DML), so there is
+    # nothing for execute_batch/execute_values to page; concatenating them
+    # into one multi-statement execute ships the whole set in a single round
+    # trip and one transaction instead of one per file.
+    LOGGER.info(
+        "Running %d migrations: %s", len(sql_files), ", ".join(p.name for p in sql_files)
+    )
     with connection_ctx() as conn:
         with conn.cursor() as cursor:
-            for sql_path in sql_files:
-                LOGGER.info("Running migration %s", sql_path.name)
-                cursor.execute(sql_path.read_text())
+            cursor.execute("\n".join(sql_path.read_text() for sql_path in sql_files))
         conn.commit()
     LOGGER.info("Migrations complete.")
 
 
-__all__ = ["get_connection", "connection_ctx", "run_migrations"]
+__all__ = [
+    "get_connection",
+    "connection_ctx",
+    "borrowed_connection",
+    "open_pool",
+    "close_pool",
+    "run_migrations",
+]
@@ -1,8 +1,13 @@
 """Kalshi trading client wrapper."""
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from ..util.logging import get_logger
 
 from kalshi_python import ApiClient, Configuration
 from kalshi_python.api.portfolio_api import PortfolioApi
@@ -10,11 +15,22 @@ from kalshi_python.models import CreateOrderRequest
 
 from ..config import get_kalshi_creds, get_kalshi_env
 
+LOGGER = get_logger(__name__)
+
 DEMO_BASE_URL = "https://demo-api.kalshi.co/trade-api/v2"
 LIVE_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+# Static request fields per (side, action), built once; place_order overlays
+# only the per-order fields instead of assembling the whole kwargs dict.
+# The API expects lowercase enum values for side/action/type.
+_ORDER_KWARG_TEMPLATES = {
+    (side, action): {"side": side, "action": action, "type": "limit"}
+    for side in ("yes", "no")
+    for action in ("buy", "sell")
+}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class OrderRequest:
     market_ticker: str
     side: str  # "yes" or "no"
@@ -22,6 +38,18 @@ class OrderRequest:
     price: Optional[float]  # limit price in dollars, or None for market if supported
     direction: str = "buy"  # "buy" or "sell"
 
+    def __post_init__(self) -> None:
+        # Normalize and validate once at construction so place_order stays
+        # branch-light on the per-order path. The instance is frozen, so the
+        # normalized values go in through object.__setattr__.
+        object.__setattr__(self, "side", self.side.lower())
+        object.__setattr__(self, "direction", self.direction.lower())
+        object.__setattr__(self, "size", int(self.size))
+        if self.side not in ("yes", "no"):
+            raise ValueError("order.side must be 'yes' or 'no'")
+        if self.direction not in ("buy", "sell"):
+            raise ValueError("order.direction must be 'buy' or 'sell'")
+
 
 class ExecutionClient:
     """Lightweight wrapper for the Kalshi Trading/Portfolio API."""
@@ -32,6 +60,9 @@ class ExecutionClient:
 
         configuration = Configuration()
         configuration.host = DEMO_BASE_URL if env == "demo" else LIVE_BASE_URL
+        # Size the urllib3 pool so bursty order placement reuses keepalive
+        # connections instead of opening one per request.
+        configuration.connection_pool_maxsize = int(os.getenv("KALSHI_POOL", "20"))
 
         self.api_client = ApiClient(configuration=configuration)
         self.api_client.set_kalshi_auth(api_key_id, api_key_secret)
@@ -40,24 +71,19 @@ class ExecutionClient:
     def place_order(self, order: OrderRequest) -> Dict[str, Any]:
         """Place an order via the Trading API."""
 
-        side = order.side.lower()
-        direction = order.direction.lower()
-        if side not in ("yes", "no"):
-            raise ValueError("order.side must be 'yes' or 'no'")
-        if direction not in ("buy", "sell"):
-            raise ValueError("order.direction must be 'buy' or 'sell'")
+        # side/direction are normalized and validated by OrderRequest itself.
+        side = order.side
+        direction = order.direction
 
         price_cents: Optional[int] = None
         if order.price is not None:
-            price_cents = max(1, min(99, int(round(order.price * 100))))
+            cents = int(round(order.price * 100))
+            price_cents = 1 if cents < 1 else 99 if cents > 99 else cents
 
-        # API expects lowercase enum values for side/action/type.
         req_kwargs: Dict[str, Any] = {
+            **_ORDER_KWARG_TEMPLATES[(side, direction)],
             "ticker": order.market_ticker,
-            "side": side,
-            "action": direction,
-            "type": "limit",
-            "count": int(order.size),
+            "count": order.size,
         }
         if side == "yes":
             req_kwargs["yes_price"] = price_cents
@@ -81,6 +107,36 @@ class ExecutionClient:
             "raw": resp.to_dict() if hasattr(resp, "to_dict") else resp,
         }
 
+    def _place_order_or_error(self, order: OrderRequest) -> Dict[str, Any]:
+        try:
+            return self.place_order(order)
+        except Exception as exc:
+            LOGGER.exception("Order placement failed for %s: %s", order.market_ticker, exc)
+            return {
+                "order_id": None,
+                "status": "error",
+                "filled_size": None,
+                "avg_price": None,
+                "raw": None,
+                "error": str(exc),
+            }
+
+    def place_orders(self, orders: List[OrderRequest], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """Place many orders concurrently, preserving input order.
+
+        Each placement is a blocking HTTP round trip, so a small thread pool
+        over the SDK's keepalive connection pool brings multi-market batch
+        latency close to a single order's. One failed order reports an
+        ``error`` entry instead of aborting the rest of the batch.
+        """
+
+        if not orders:
+            return []
+        if len(orders) == 1:
+            return [self._place_order_or_error(orders[0])]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(orders))) as pool:
+            return list(pool.map(self._place_order_or_error, orders))
+
     def get_open_exposure_usd(self) -> float:
         """Return open exposure; stubbed to 0 for now."""
 
@@ -88,4 +144,24 @@ class ExecutionClient:
         return 0.0
 
 
-__all__ = ["ExecutionClient", "OrderRequest"]
+_client: Optional[ExecutionClient] = None
+_client_lock = threading.Lock()
+
+
+def get_execution_client() -> ExecutionClient:
+    """Return the shared ExecutionClient, creating it lazily on first use.
+
+    Construction reads credentials and sets up the SDK's HTTP session; the
+    singleton keeps that (and its keepalive connections) alive across order
+    bursts instead of rebuilding per call. Same shape as the db pool init.
+    """
+
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ExecutionClient()
+    return _client
+
+
+__all__ = ["ExecutionClient", "OrderRequest", "get_execution_client"]
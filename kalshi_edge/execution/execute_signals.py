@@ -2,8 +2,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Mapping
-import math
-from datetime import datetime, timezone, timedelta
 
 from kalshi_edge.config import (
     get_execution_mode,
@@ -11,20 +9,24 @@ from kalshi_edge.config import (
     get_kalshi_env,
     get_current_bankroll_usd,
     get_max_risk_fraction_per_trade,
+    invalidate_bankroll_cache,
 )
-from kalshi_edge.db import get_connection
-from kalshi_edge.execution.client import ExecutionClient, OrderRequest
+from psycopg2.extras import RealDictCursor, execute_values
+
+from kalshi_edge.db import borrowed_connection
+from kalshi_edge.execution.client import OrderRequest, get_execution_client
 from kalshi_edge.util.logging import get_logger
-from kalshi_edge.portfolio.pnl import record_trade
+from kalshi_edge.portfolio.pnl import record_trades
 
 LOGGER = get_logger(__name__)
 MAX_CONTRACTS_CAP = 1000  # hard safety cap on contract count per order
 
 
-def fetch_pending_signals(limit: int = 50) -> List[Dict[str, Any]]:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
+def fetch_pending_signals(limit: int = 50, conn=None) -> List[Dict[str, Any]]:
+    # RealDictCursor builds the row mappings in the driver instead of the
+    # former tuple fetch + dict(zip(cols, row)) pass per row in Python.
+    with borrowed_connection(conn) as c:
+        cur = c.cursor(cursor_factory=RealDictCursor)
         cur.execute(
             """
             SELECT id, created_at, market_ticker, side, threshold, category, expiry_bucket,
@@ -36,91 +38,96 @@ def fetch_pending_signals(limit: int = 50) -> List[Dict[str, Any]]:
             """,
             (limit,),
         )
-        rows = cur.fetchall()
-    finally:
-        conn.close()
-
-    cols = [
-        "id",
-        "created_at",
-        "market_ticker",
-        "side",
-        "threshold",
-        "category",
-        "expiry_bucket",
-        "p_mkt",
-        "p_true_est",
-        "expected_value",
-        "size",
-        "status",
-    ]
-    return [dict(zip(cols, row)) for row in rows]
+        signals = cur.fetchall()
+
+    # Cast the numeric columns once here (Decimal -> float, etc.) so the
+    # sizing and risk math downstream never re-coerces per use.
+    for sig in signals:
+        if sig["p_mkt"] is not None:
+            sig["p_mkt"] = float(sig["p_mkt"])
+        if sig["size"] is not None:
+            sig["size"] = int(sig["size"])
+    return signals
 
 
 def estimate_trade_risk_usd(signal: Dict[str, Any]) -> float:
+    # side is stored lowercase ('yes'/'no', enforced by signals_side_check),
+    # so this stays a single expression with no per-call normalization.
     p_mkt = float(signal["p_mkt"])
     size = int(signal["size"])
-    side = (signal["side"] or "").lower()
-    if side == "yes":
-        return p_mkt * size
-    return (1.0 - p_mkt) * size
+    return p_mkt * size if signal["side"] == "yes" else size - p_mkt * size
+
+
+# Open risk per market, aggregated server-side: pending/sent signal cost
+# unioned with live position cost (future expiry, updated within two days).
+# The LATERAL normalizes prices the same way as the API's exposure query:
+# cents scaled to dollars, NULLs and negatives clamped to zero.
+_RISK_AGGREGATE = """
+    SELECT market_ticker,
+           SUM(ABS(CASE WHEN side = 'yes' THEN norm.price ELSE 1.0 - norm.price END * size))::float8
+    FROM exposures
+    CROSS JOIN LATERAL (
+        SELECT GREATEST(
+            CASE
+                WHEN COALESCE(price, 0) > 1.0 THEN COALESCE(price, 0) / 100.0
+                ELSE COALESCE(price, 0)
+            END,
+            0
+        ) AS price
+    ) AS norm
+    GROUP BY market_ticker
+"""
+
+_SIGNALS_RISK_SELECT = """
+    SELECT market_ticker, side, p_mkt AS price, size
+    FROM signals
+    WHERE status IN ('pending', 'sent')
+"""
+
+_EXISTING_RISK_SQL = f"""
+    WITH exposures AS (
+        {_SIGNALS_RISK_SELECT}
+        UNION ALL
+        SELECT p.market_ticker, p.side, p.avg_entry_price AS price, p.size
+        FROM positions p
+        LEFT JOIN markets m ON p.market_ticker = m.market_id
+        WHERE m.expiration_ts IS NOT NULL
+          AND m.expiration_ts >= NOW()
+          AND (p.updated_at IS NULL OR p.updated_at >= NOW() - INTERVAL '2 days')
+    )
+    {_RISK_AGGREGATE}
+"""
+
+_SIGNALS_ONLY_RISK_SQL = f"""
+    WITH exposures AS (
+        {_SIGNALS_RISK_SELECT}
+    )
+    {_RISK_AGGREGATE}
+"""
 
 
 def compute_existing_risk(conn) -> Dict[str, Any]:
-    def _norm_price(val: float) -> float:
-        try:
-            p = float(val)
-        except Exception:
-            return 0.0
-        if p > 1.0:
-            p = p / 100.0
-        if p < 0:
-            p = 0.0
-        return p
-
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT market_ticker, side, p_mkt, size
-        FROM signals
-        WHERE status IN ('pending', 'sent')
-        """
-    )
-    per_market: Dict[str, float] = {}
-    total = 0.0
-    for market_ticker, side, p_mkt, size in cur.fetchall():
-        sig = {"market_ticker": market_ticker, "side": side, "p_mkt": _norm_price(p_mkt), "size": int(size)}
-        r = estimate_trade_risk_usd(sig)
-        per_market[market_ticker] = per_market.get(market_ticker, 0.0) + r
-        total += r
-
-    # include open positions risk (best-effort; table may be absent)
+    """Aggregate open risk (pending/sent signals plus live positions).
+
+    A single UNION ALL + GROUP BY replaces the former two fetches and the
+    Python tally, so the per-row risk math runs as vector ops inside
+    Postgres and only one aggregated row per market crosses the wire.
+    Positions stay best-effort: if that branch fails (e.g. the table is
+    absent), fall back to signals-only, as before.
+    """
+
     try:
-        cur.execute(
-            """
-            SELECT p.market_ticker, p.side, p.size, p.avg_entry_price, m.expiration_ts, p.updated_at
-            FROM positions p
-            LEFT JOIN markets m ON p.market_ticker = m.market_id
-            """
-        )
-        now = datetime.now(timezone.utc)
-        stale_cutoff = now - timedelta(days=2)
-        for market_ticker, side, size, avg_price, expiration_ts, updated_at in cur.fetchall():
-            # Ignore positions without a valid future expiry or very stale updates.
-            if not expiration_ts or expiration_ts < now:
-                continue
-            if updated_at and updated_at < stale_cutoff:
-                continue
-            avg_price = _norm_price(avg_price)
-            if side == "yes":
-                r = abs(avg_price * size)
-            else:
-                r = abs((1.0 - avg_price) * size)
-            per_market[market_ticker] = per_market.get(market_ticker, 0.0) + r
-            total += r
+        cur = conn.cursor()
+        cur.execute(_EXISTING_RISK_SQL)
+        rows = cur.fetchall()
     except Exception:
-        pass
-    return {"total": total, "per_market": per_market}
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(_SIGNALS_ONLY_RISK_SQL)
+        rows = cur.fetchall()
+
+    per_market = {market_ticker: risk for market_ticker, risk in rows}
+    return {"total": sum(per_market.values()), "per_market": per_market}
 
 
 def compute_order_size_for_signal(
@@ -154,16 +161,50 @@ def compute_order_size_for_signal(
         return 0, risk_per_contract
 
     # Default target risk is ~$3 per order unless caps force lower.
+    # -(-x // y) is ceiling division without touching math.ceil.
     target_risk = min(3.0, max_risk)
-    size = int(math.ceil(target_risk / risk_per_contract))
+    size = int(-(-target_risk // risk_per_contract))
     # Ensure we don't exceed max_risk
     if size * risk_per_contract > max_risk:
         size = int(max_risk // risk_per_contract)
     if size <= 0:
         return 0, risk_per_contract
 
-    size = min(size, MAX_CONTRACTS_CAP)
-    return size, risk_per_contract
+    return min(size, MAX_CONTRACTS_CAP), risk_per_contract
+
+
+# Single-row status update, PREPAREd once per pooled session so repeat calls
+# skip the parse/plan step and ship only the seven parameters. The plain-SQL
+# twin below serves connections that don't track prepared statements. The
+# hot-path statements are bytes so psycopg2 skips re-encoding them per call.
+_SIGNAL_UPDATE_PREPARE = b"""
+    PREPARE upd_signal(text, text, text, double precision, integer, text, bigint) AS
+    UPDATE signals
+    SET status = $1,
+        execution_mode = $2,
+        order_id = COALESCE($3, order_id),
+        executed_price = COALESCE($4, executed_price),
+        executed_size = COALESCE($5, executed_size),
+        last_error = COALESCE($6, last_error),
+        sent_at = CASE WHEN $1 IN ('sent', 'filled', 'simulated') AND sent_at IS NULL THEN NOW() ELSE sent_at END,
+        filled_at = CASE WHEN $1 = 'filled' AND filled_at IS NULL THEN NOW() ELSE filled_at END
+    WHERE id = $7
+"""
+
+_SIGNAL_UPDATE_EXECUTE = b"EXECUTE upd_signal (%s, %s, %s, %s, %s, %s, %s)"
+
+_SIGNAL_UPDATE_SQL = b"""
+    UPDATE signals
+    SET status = %s,
+        execution_mode = %s,
+        order_id = COALESCE(%s, order_id),
+        executed_price = COALESCE(%s, executed_price),
+        executed_size = COALESCE(%s, executed_size),
+        last_error = COALESCE(%s, last_error),
+        sent_at = CASE WHEN %s IN ('sent', 'filled', 'simulated') AND sent_at IS NULL THEN NOW() ELSE sent_at END,
+        filled_at = CASE WHEN %s = 'filled' AND filled_at IS NULL THEN NOW() ELSE filled_at END
+    WHERE id = %s
+"""
 
 
 def update_signal_execution(
@@ -175,212 +216,282 @@ def update_signal_execution(
     executed_price: float | None = None,
     executed_size: int | None = None,
     error: str | None = None,
+    conn=None,
 ) -> None:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE signals
-            SET status = %s,
-                execution_mode = %s,
-                order_id = COALESCE(%s, order_id),
-                executed_price = COALESCE(%s, executed_price),
-                executed_size = COALESCE(%s, executed_size),
-                last_error = COALESCE(%s, last_error),
-                sent_at = CASE WHEN %s IN ('sent', 'filled', 'simulated') AND sent_at IS NULL THEN NOW() ELSE sent_at END,
-                filled_at = CASE WHEN %s = 'filled' AND filled_at IS NULL THEN NOW() ELSE filled_at END
-            WHERE id = %s
-            """,
-            (
-                status,
-                execution_mode,
-                order_id,
-                executed_price,
-                executed_size,
-                error,
-                status,
-                status,
-                signal_id,
-            ),
+    with borrowed_connection(conn) as c:
+        cur = c.cursor()
+        prepared = getattr(c, "prepared_statements", None)
+        if prepared is not None:
+            freshly_prepared = "upd_signal" not in prepared
+            if freshly_prepared:
+                cur.execute(_SIGNAL_UPDATE_PREPARE)
+            cur.execute(
+                _SIGNAL_UPDATE_EXECUTE,
+                (status, execution_mode, order_id, executed_price, executed_size, error, signal_id),
+            )
+            c.commit()
+            # PREPARE is transactional; record it only once the commit has
+            # made it stick for the rest of the session.
+            if freshly_prepared:
+                prepared.add("upd_signal")
+        else:
+            cur.execute(
+                _SIGNAL_UPDATE_SQL,
+                (
+                    status,
+                    execution_mode,
+                    order_id,
+                    executed_price,
+                    executed_size,
+                    error,
+                    status,
+                    status,
+                    signal_id,
+                ),
+            )
+            c.commit()
+
+
+# Same update as update_signal_execution, applied to a whole batch from a
+# VALUES list in one statement. Casts pin the column types so batches whose
+# optional fields are all NULL still plan cleanly.
+_SIGNAL_UPDATE_TEMPLATE = "(%s::bigint, %s, %s, %s, %s::double precision, %s::integer, %s)"
+_SIGNAL_UPDATE_BATCH_SQL = """
+    UPDATE signals
+    SET status = v.status,
+        execution_mode = v.execution_mode,
+        order_id = COALESCE(v.order_id, signals.order_id),
+        executed_price = COALESCE(v.executed_price, signals.executed_price),
+        executed_size = COALESCE(v.executed_size, signals.executed_size),
+        last_error = COALESCE(v.last_error, signals.last_error),
+        sent_at = CASE
+            WHEN v.status IN ('sent', 'filled', 'simulated') AND signals.sent_at IS NULL THEN NOW()
+            ELSE signals.sent_at
+        END,
+        filled_at = CASE
+            WHEN v.status = 'filled' AND signals.filled_at IS NULL THEN NOW()
+            ELSE signals.filled_at
+        END
+    FROM (VALUES %s) AS v(id, status, execution_mode, order_id, executed_price, executed_size, last_error)
+    WHERE signals.id = v.id
+"""
+
+
+def flush_signal_updates(conn, updates: List[tuple]) -> None:
+    """Apply queued per-signal execution updates in one statement and commit."""
+
+    if not updates:
+        return
+    with conn.cursor() as cur:
+        execute_values(
+            cur, _SIGNAL_UPDATE_BATCH_SQL, updates, template=_SIGNAL_UPDATE_TEMPLATE, page_size=200
         )
-        conn.commit()
-    finally:
-        conn.close()
+    conn.commit()
 
 
 def execute_signals(batch_limit: int = 50) -> int:
     mode = get_execution_mode()
     env = get_kalshi_env()
     limits = get_risk_limits()
-    signals = fetch_pending_signals(limit=batch_limit)
-    if not signals:
-        return 0
 
     client = None
     if mode == "live":
         try:
-            client = ExecutionClient()
+            client = get_execution_client()
             LOGGER.warning("Execution running in LIVE mode against %s", env)
         except Exception as exc:
             LOGGER.exception("Failed to initialize ExecutionClient; falling back to simulate. %s", exc)
             mode = "simulate"
 
-    conn = get_connection()
-    try:
+    # One pooled session covers the fetch, risk aggregation, bankroll read,
+    # trade recording, and every per-signal status update in the batch. The fetch and risk
+    # selects stay two statements: psycopg2 has no pipeline mode, and folding
+    # unrelated result sets into one query would also defeat the best-effort
+    # positions fallback inside compute_existing_risk.
+    with borrowed_connection() as conn:
+        signals = fetch_pending_signals(limit=batch_limit, conn=conn)
+        if not signals:
+            return 0
+
         risk_state = compute_existing_risk(conn)
         total_risk = risk_state["total"]
         per_market = risk_state["per_market"]
         bankroll = get_current_bankroll_usd(conn)
-    finally:
-        conn.close()
 
-    executed_count = 0
+        executed_count = 0
+
+        # Buffer status updates and executed trades during the loop and apply
+        # each set in one round trip at the end instead of per-signal writes.
+        updates: List[tuple] = []
+        executed_trades: List[Dict[str, Any]] = []
+
+        def queue_update(
+            signal_id: int,
+            status: str,
+            *,
+            order_id: str | None = None,
+            executed_price: float | None = None,
+            executed_size: int | None = None,
+            error: str | None = None,
+        ) -> None:
+            updates.append(
+                (signal_id, status, mode, order_id, executed_price, executed_size, error)
+            )
 
-    for sig in signals:
-        sig_id = sig["id"]
-        market_ticker = sig["market_ticker"]
+        # Phase 1: plan sequentially. Risk checks and budget decrements stay
+        # single-threaded so approvals are deterministic, and the budget is
+        # consumed at approval time — before any order goes out — so a slow
+        # or failed send can never let a later signal overshoot the caps.
+        # There is deliberately no bulk pre-filter pass here: each signal's
+        # size (and hence its risk) depends on the budget left by earlier
+        # approvals, so the checks are inherently order-dependent.
         trade_direction = "buy"  # buy YES or buy NO; selling paths can be added later.
-
-        current_market_risk = per_market.get(market_ticker, 0.0)
-        size, risk_per_contract = compute_order_size_for_signal(
-            sig,
-            bankroll,
-            limits,
-            per_market_risk=current_market_risk,
-            total_risk=total_risk,
-        )
-
-        if size <= 0:
-            update_signal_execution(
-                sig_id,
-                status="ignored",
-                execution_mode=mode,
-                error="Insufficient risk budget for dynamic sizing",
+        # Hoisted out of the loop: three dict lookups per signal become three
+        # locals for the whole batch.
+        max_trade = limits["max_risk_per_trade"]
+        max_market = limits["max_risk_per_market"]
+        max_total = limits["max_risk_total"]
+        planned: List[Dict[str, Any]] = []
+        for sig in signals:
+            sig_id = sig["id"]
+            market_ticker = sig["market_ticker"]
+
+            current_market_risk = per_market.get(market_ticker, 0.0)
+            size, risk_per_contract = compute_order_size_for_signal(
+                sig,
+                bankroll,
+                limits,
+                per_market_risk=current_market_risk,
+                total_risk=total_risk,
             )
-            continue
 
-        risk_new = risk_per_contract * size
+            if size <= 0:
+                queue_update(sig_id, "ignored", error="Insufficient risk budget for dynamic sizing")
+                continue
 
-        if risk_new > limits["max_risk_per_trade"]:
-            update_signal_execution(
-                sig_id,
-                status="ignored",
-                execution_mode=mode,
-                error=f"Risk per trade {risk_new:.2f} exceeds limit {limits['max_risk_per_trade']:.2f}",
-            )
-            continue
-
-        market_risk = per_market.get(market_ticker, 0.0)
-        if market_risk + risk_new > limits["max_risk_per_market"]:
-            update_signal_execution(
-                sig_id,
-                status="ignored",
-                execution_mode=mode,
-                error=f"Per-market risk {market_risk + risk_new:.2f} exceeds limit {limits['max_risk_per_market']:.2f}",
+            risk_new = risk_per_contract * size
+
+            # One conditional chain instead of three if/continue blocks; the
+            # rejection message is only built on the branch that trips.
+            exceeded = (
+                f"Risk per trade {risk_new:.2f} exceeds limit {max_trade:.2f}"
+                if risk_new > max_trade
+                else f"Per-market risk {current_market_risk + risk_new:.2f} exceeds limit {max_market:.2f}"
+                if current_market_risk + risk_new > max_market
+                else f"Total risk {total_risk + risk_new:.2f} exceeds limit {max_total:.2f}"
+                if total_risk + risk_new > max_total
+                else None
             )
-            continue
-
-        if total_risk + risk_new > limits["max_risk_total"]:
-            update_signal_execution(
-                sig_id,
-                status="ignored",
-                execution_mode=mode,
-                error=f"Total risk {total_risk + risk_new:.2f} exceeds limit {limits['max_risk_total']:.2f}",
-            )
-            continue
+            if exceeded is not None:
+                queue_update(sig_id, "ignored", error=exceeded)
+                continue
 
-        if mode == "simulate":
-            exec_price = float(sig["p_mkt"])
-            if (sig.get("side") or "").lower() == "no":
-                exec_price = 1.0 - exec_price
-            update_signal_execution(
-                sig_id,
-                status="simulated",
-                execution_mode=mode,
-                executed_price=exec_price,
-                executed_size=size,
-            )
-            record_trade(
+            # p_mkt was cast to float at fetch time; side is stored lowercase.
+            price = 1.0 - sig["p_mkt"] if sig["side"] == "no" else sig["p_mkt"]
+            planned.append(
                 {
-                    "signal_id": sig_id,
+                    "sig_id": sig_id,
                     "market_ticker": market_ticker,
                     "side": sig["side"],
                     "size": size,
-                    "price": exec_price,
-                    "direction": trade_direction,
+                    "price": price,
                 }
             )
-        else:
-            try:
-                limit_price = float(sig["p_mkt"])
-                if (sig.get("side") or "").lower() == "no":
-                    limit_price = 1.0 - limit_price
-                order_req = OrderRequest(
-                    market_ticker=market_ticker,
-                    side=sig["side"],
-                    size=size,
-                    price=limit_price,
-                    direction=trade_direction,
-                )
-                if client is None:
-                    raise RuntimeError("Execution client not initialized; cannot send live orders")
-                LOGGER.info(
-                    "Placing order live env=%s sig=%s ticker=%s side=%s size=%s price=%.4f",
-                    env,
-                    sig_id,
-                    market_ticker,
-                    sig["side"],
-                    size,
-                    limit_price,
-                )
-                resp = client.place_order(order_req)  # type: ignore[arg-type]
-                order_id = str(resp.get("order_id") or resp.get("id") or "")
-                executed_price = float(resp.get("avg_price") or limit_price)
-                executed_size = int(resp.get("filled_size") or size)
-                status = resp.get("status") or "sent"
-                LOGGER.info(
-                    "Order response sig=%s ticker=%s status=%s order_id=%s filled=%s price=%.4f raw=%s",
-                    sig_id,
-                    market_ticker,
-                    status,
-                    order_id,
-                    executed_size,
-                    executed_price,
-                    resp,
-                )
-                update_signal_execution(
-                    sig_id,
-                    status=status,
-                    execution_mode=mode,
-                    order_id=order_id,
-                    executed_price=executed_price,
-                    executed_size=executed_size,
+            total_risk += risk_new
+            per_market[market_ticker] = current_market_risk + risk_new
+
+        # Phase 2: act on the approved plans. Simulated fills stay in-process;
+        # live orders go out concurrently through place_orders, so batch
+        # latency is roughly one order's round trip instead of the sum. The
+        # DB side is two batched statements after the sends, so there is no
+        # per-signal UPDATE left to overlap with the HTTP fan-out.
+        if mode == "simulate":
+            for plan in planned:
+                queue_update(
+                    plan["sig_id"],
+                    "simulated",
+                    executed_price=plan["price"],
+                    executed_size=plan["size"],
                 )
-                record_trade(
+                executed_trades.append(
                     {
-                        "signal_id": sig_id,
-                        "market_ticker": market_ticker,
-                        "side": sig["side"],
-                        "size": executed_size,
-                        "price": executed_price,
+                        "signal_id": plan["sig_id"],
+                        "market_ticker": plan["market_ticker"],
+                        "side": plan["side"],
+                        "size": plan["size"],
+                        "price": plan["price"],
                         "direction": trade_direction,
                     }
                 )
-            except Exception as exc:  # pragma: no cover - defensive
-                update_signal_execution(
-                    sig_id,
-                    status="error",
-                    execution_mode=mode,
-                    error=str(exc),
-                )
-                continue
-
-        total_risk += risk_new
-        per_market[market_ticker] = per_market.get(market_ticker, 0.0) + risk_new
-        executed_count += 1
-
-    return executed_count
+                executed_count += 1
+        elif planned:
+            if client is None:
+                for plan in planned:
+                    queue_update(
+                        plan["sig_id"],
+                        "error",
+                        error="Execution client not initialized; cannot send live orders",
+                    )
+            else:
+                orders = [
+                    OrderRequest(
+                        market_ticker=plan["market_ticker"],
+                        side=plan["side"],
+                        size=plan["size"],
+                        price=plan["price"],
+                        direction=trade_direction,
+                    )
+                    for plan in planned
+                ]
+                LOGGER.warning("Placing %d orders live env=%s", len(orders), env)
+                responses = client.place_orders(orders)
+                for plan, resp in zip(planned, responses):
+                    sig_id = plan["sig_id"]
+                    if resp.get("error"):
+                        queue_update(sig_id, "error", error=str(resp["error"]))
+                        continue
+                    order_id = str(resp.get("order_id") or resp.get("id") or "")
+                    executed_price = float(resp.get("avg_price") or plan["price"])
+                    executed_size = int(resp.get("filled_size") or plan["size"])
+                    status = resp.get("status") or "sent"
+                    LOGGER.info(
+                        "Order response sig=%s ticker=%s status=%s order_id=%s filled=%s price=%.4f",
+                        sig_id,
+                        plan["market_ticker"],
+                        status,
+                        order_id,
+                        executed_size,
+                        executed_price,
+                    )
+                    queue_update(
+                        sig_id,
+                        status,
+                        order_id=order_id,
+                        executed_price=executed_price,
+                        executed_size=executed_size,
+                    )
+                    executed_trades.append(
+                        {
+                            "signal_id": sig_id,
+                            "market_ticker": plan["market_ticker"],
+                            "side": plan["side"],
+                            "size": executed_size,
+                            "price": executed_price,
+                            "direction": trade_direction,
+                        }
+                    )
+                    executed_count += 1
+
+        # One transaction for both batches: record_trades leaves its writes
+        # uncommitted on a shared conn, and flush_signal_updates commits them
+        # together with the status changes. Committing trades first would let
+        # a crash before the status flush leave every signal 'pending', and
+        # the next sweep would re-send the whole batch of live orders.
+        record_trades(executed_trades, conn=conn)
+        flush_signal_updates(conn, updates)
+        if executed_trades:
+            invalidate_bankroll_cache()
+        return executed_count
 
 
 def main() -> None:
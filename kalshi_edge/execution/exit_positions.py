@@ -2,33 +2,38 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List
-
-from psycopg2.extras import RealDictCursor
+from typing import Any, Dict, List, Tuple
 
 from ..config import (
     get_execution_mode,
     get_kalshi_env,
     get_take_profit_factor,
     get_pro_longshot_take_profit_factor,
+    invalidate_bankroll_cache,
 )
 from ..db import get_connection
-from ..execution.client import ExecutionClient, OrderRequest
-from ..portfolio.pnl import record_trade
+from ..execution.client import OrderRequest, get_execution_client
+from ..portfolio.pnl import record_trades
 from ..util.logging import get_logger
 
 LOGGER = get_logger(__name__)
 EXPIRY_HARD_LIMIT_HOURS = 24
 
+# Built once; the per-position filter loop used to rebuild these set
+# literals on every row.
+_PRO_LONGSHOT_CATEGORIES = frozenset(
+    {"sports", "football", "basketball", "hockey", "nfl", "nba", "nhl", "mlb"}
+)
+_COLLEGE_CATEGORIES = frozenset({"college", "ncaa", "ncaaf", "ncaab"})
+
 
-def _fetch_positions_with_prices(cur: RealDictCursor) -> List[Dict[str, Any]]:
+def _fetch_positions_with_prices(cur) -> List[Tuple]:
+    # The LATERAL does one index seek down (market_id, timestamp DESC) per
+    # open position; the old DISTINCT ON CTE scanned the whole prices table
+    # no matter how few positions were open. Plain tuple rows — the scan
+    # loop destructures them, so there is no dict per row to build.
     cur.execute(
         """
-        WITH latest_prices AS (
-            SELECT DISTINCT ON (market_id) market_id, last_yes, timestamp
-            FROM prices
-            ORDER BY market_id, timestamp DESC
-        )
         SELECT
             p.market_ticker,
             p.side,
@@ -39,7 +44,13 @@ def _fetch_positions_with_prices(cur: RealDictCursor) -> List[Dict[str, Any]]:
             lp.last_yes AS current_price
         FROM positions p
         LEFT JOIN markets m ON m.market_id = p.market_ticker
-        LEFT JOIN latest_prices lp ON lp.market_id = p.market_ticker
+        LEFT JOIN LATERAL (
+            SELECT last_yes
+            FROM prices
+            WHERE market_id = p.market_ticker
+            ORDER BY timestamp DESC
+            LIMIT 1
+        ) lp ON TRUE
         WHERE p.size <> 0
         """
     )
@@ -63,8 +74,7 @@ def _is_pro_longshot(side: str, entry: float, category: str | None) -> bool:
     if entry is None or entry <= 0:
         return False
     cat = (category or "").lower()
-    pro_cats = {"sports", "football", "basketball", "hockey", "nfl", "nba", "nhl", "mlb"}
-    return entry <= 0.15 and (cat in pro_cats or cat.startswith("pro"))
+    return entry <= 0.15 and (cat in _PRO_LONGSHOT_CATEGORIES or cat.startswith("pro"))
 
 
 def process_take_profit_exits() -> int:
@@ -80,23 +90,23 @@ def process_take_profit_exits() -> int:
     client = None
     if mode == "live":
         try:
-            client = ExecutionClient()
+            client = get_execution_client()
             LOGGER.warning("Exit processing running in LIVE mode against %s", env)
         except Exception as exc:  # pragma: no cover - defensive
             LOGGER.exception("Failed to init ExecutionClient; falling back to simulate. %s", exc)
             mode = "simulate"
 
     processed = 0
-    with get_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+    # Exit fills are buffered and written as one batch after the scan, so a
+    # sweep that closes several positions pays one bookkeeping round trip.
+    exit_trades: List[Dict[str, Any]] = []
+    with get_connection() as conn, conn.cursor() as cur:
         positions = _fetch_positions_with_prices(cur)
-        for pos in positions:
-            market = pos["market_ticker"]
-            side = (pos["side"] or "").lower()
-            size = int(pos["size"] or 0)
-            entry = float(pos["avg_entry_price"] or 0.0)
-            current = pos.get("current_price")
-            exp_ts = pos.get("expiration_ts")
-            cat = (pos.get("category") or "").lower()
+        for market, side, size, entry, cat, exp_ts, current in positions:
+            side = (side or "").lower()
+            size = int(size or 0)
+            entry = float(entry or 0.0)
+            cat = (cat or "").lower()
 
             if size <= 0 or side not in ("yes", "no"):
                 continue
@@ -108,7 +118,7 @@ def process_take_profit_exits() -> int:
 
             factor = factor_longshot if _is_pro_longshot(side, entry, cat) else factor_general
             college_fast_exit = (
-                cat in {"college", "ncaa", "ncaaf", "ncaab"}
+                cat in _COLLEGE_CATEGORIES
                 and side == "yes"
                 and entry <= 0.02
                 and current >= 0.10
@@ -119,7 +129,7 @@ def process_take_profit_exits() -> int:
 
             direction = "sell"  # closing reduces exposure
             if mode == "simulate":
-                record_trade(
+                exit_trades.append(
                     {
                         "signal_id": None,
                         "market_ticker": market,
@@ -145,7 +155,7 @@ def process_take_profit_exits() -> int:
                     resp = client.place_order(req)  # type: ignore[arg-type]
                     executed_price = float(resp.get("avg_price") or current)
                     executed_size = int(resp.get("filled_size") or size)
-                    record_trade(
+                    exit_trades.append(
                         {
                             "signal_id": None,
                             "market_ticker": market,
@@ -169,6 +179,13 @@ def process_take_profit_exits() -> int:
                     continue
 
             processed += 1
+
+        # record_trades joins this conn's transaction without committing;
+        # commit the batch here and refresh the cached bankroll.
+        record_trades(exit_trades, conn=conn)
+        conn.commit()
+    if exit_trades:
+        invalidate_bankroll_cache()
     return processed
 
 
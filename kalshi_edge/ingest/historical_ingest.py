@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import argparse
+import io
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import orjson
 from kalshi_python.exceptions import NotFoundException
+from psycopg2.extras import execute_values
 
 from ..db import connection_ctx
 from ..util.logging import get_logger
@@ -75,30 +78,53 @@ def normalize_market(market: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def upsert_market(cursor, market: Dict[str, Any]) -> None:
-    cursor.execute(
-        """
-        INSERT INTO markets (market_id, name, category, resolution, resolved_at, created_at, expiration_ts)
-        VALUES (%s, %s, %s, %s, %s, COALESCE(%s, NOW()), %s)
-        ON CONFLICT (market_id) DO UPDATE SET
-            name = EXCLUDED.name,
-            category = EXCLUDED.category,
-            resolution = EXCLUDED.resolution,
-            resolved_at = EXCLUDED.resolved_at,
-            expiration_ts = EXCLUDED.expiration_ts
-        """,
-        (
-            market["market_id"],
-            market["name"],
-            market["category"],
-            market["resolution"],
-            market["resolved_at"],
-            market["created_at"],
-            market.get("expiration_ts"),
-        ),
+_MARKET_UPSERT_SQL = """
+    INSERT INTO markets (market_id, name, category, resolution, resolved_at, created_at, expiration_ts)
+    VALUES %s
+    ON CONFLICT (market_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        category = EXCLUDED.category,
+        resolution = EXCLUDED.resolution,
+        resolved_at = EXCLUDED.resolved_at,
+        expiration_ts = EXCLUDED.expiration_ts
+"""
+_MARKET_UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, COALESCE(%s, NOW()), %s)"
+_MARKET_UPSERT_BATCH_SIZE = 500
+
+
+def upsert_markets(cursor, markets: List[Dict[str, Any]]) -> None:
+    """Upsert a batch of normalized markets in one VALUES statement.
+
+    prices rows reference markets(market_id), so callers must flush their
+    pending market batch before ingesting candles for those markets.
+    """
+
+    if not markets:
+        return
+    execute_values(
+        cursor,
+        _MARKET_UPSERT_SQL,
+        [
+            (
+                market["market_id"],
+                market["name"],
+                market["category"],
+                market["resolution"],
+                market["resolved_at"],
+                market["created_at"],
+                market.get("expiration_ts"),
+            )
+            for market in markets
+        ],
+        template=_MARKET_UPSERT_TEMPLATE,
+        page_size=_MARKET_UPSERT_BATCH_SIZE,
     )
 
 
+def upsert_market(cursor, market: Dict[str, Any]) -> None:
+    upsert_markets(cursor, [market])
+
+
 def _normalize_yes_price(value: Optional[float]) -> Optional[float]:
     if value is None:
         return None
@@ -107,7 +133,10 @@ def _normalize_yes_price(value: Optional[float]) -> Optional[float]:
     return float(value)
 
 
-def _candles_to_price_rows(market_id: str, candles: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+def _candles_to_price_rows(market_id: str, candles: Iterable[Dict[str, Any]]) -> Iterable[Tuple]:
+    """Yield (market_id, timestamp, bid_yes, ask_yes, last_yes, volume, open_interest)
+    tuples, matching the prices insert column order."""
+
     for candle in candles:
         close_ts = candle.get("end_ts") or candle.get("close_ts") or candle.get("timestamp")
         if close_ts is None:
@@ -118,15 +147,83 @@ def _candles_to_price_rows(market_id: str, candles: Iterable[Dict[str, Any]]) ->
 
         # SDK candlesticks expose OHLC in cents; use close as the representative YES price.
         yes_price = _normalize_yes_price(candle.get("close"))
-        yield {
-            "market_id": market_id,
-            "timestamp": timestamp,
-            "last_yes": yes_price,
-            "bid_yes": None,
-            "ask_yes": None,
-            "volume": candle.get("volume"),
-            "open_interest": None,
-        }
+        yield (market_id, timestamp, None, None, yes_price, candle.get("volume"), None)
+
+
+_PRICE_INSERT_BATCH_SQL = """
+    INSERT INTO prices (market_id, timestamp, bid_yes, ask_yes, last_yes, volume, open_interest)
+    VALUES %s
+    ON CONFLICT (market_id, timestamp) DO NOTHING
+"""
+_PRICE_INSERT_PAGE_SIZE = 1000
+
+# Above this many rows, COPY into a session-local staging table beats even
+# batched VALUES inserts; the merge keeps the ON CONFLICT idempotency.
+_PRICE_COPY_THRESHOLD = 5000
+
+_PRICE_STAGING_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS prices_staging (
+        market_id TEXT,
+        timestamp TIMESTAMPTZ,
+        bid_yes NUMERIC(10,4),
+        ask_yes NUMERIC(10,4),
+        last_yes NUMERIC(10,4),
+        volume INTEGER,
+        open_interest INTEGER
+    )
+"""
+_PRICE_STAGING_COLUMNS = "(market_id, timestamp, bid_yes, ask_yes, last_yes, volume, open_interest)"
+_PRICE_STAGING_MERGE_SQL = f"""
+    INSERT INTO prices {_PRICE_STAGING_COLUMNS}
+    SELECT market_id, timestamp, bid_yes, ask_yes, last_yes, volume, open_interest
+    FROM prices_staging
+    ON CONFLICT (market_id, timestamp) DO NOTHING
+"""
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _copy_prices(cursor, rows: List[Tuple]) -> int:
+    """COPY price tuples into a temp staging table and merge into prices."""
+
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(value) for value in row))
+        buf.write("\n")
+    buf.seek(0)
+    cursor.execute(_PRICE_STAGING_DDL)
+    cursor.execute("TRUNCATE prices_staging")
+    cursor.copy_expert(f"COPY prices_staging {_PRICE_STAGING_COLUMNS} FROM STDIN", buf)
+    cursor.execute(_PRICE_STAGING_MERGE_SQL)
+    return cursor.rowcount
+
+
+def insert_prices(cursor, rows: List[Tuple]) -> int:
+    """Insert price tuples; returns the number actually inserted.
+
+    Rows are tuples in insert column order (see _candles_to_price_rows).
+    Large histories go through the COPY + staging-table merge; smaller sets
+    use VALUES batches, paged manually (rowcount only reflects the last
+    statement issued) so the insert count stays accurate.
+    """
+
+    if len(rows) >= _PRICE_COPY_THRESHOLD:
+        return _copy_prices(cursor, rows)
+
+    inserted = 0
+    for start in range(0, len(rows), _PRICE_INSERT_PAGE_SIZE):
+        execute_values(
+            cursor,
+            _PRICE_INSERT_BATCH_SQL,
+            rows[start : start + _PRICE_INSERT_PAGE_SIZE],
+            page_size=_PRICE_INSERT_PAGE_SIZE,
+        )
+        inserted += cursor.rowcount
+    return inserted
 
 
 def insert_price(cursor, row: Dict[str, Any]) -> bool:
@@ -149,12 +246,52 @@ def insert_price(cursor, row: Dict[str, Any]) -> bool:
     return cursor.rowcount > 0
 
 
+# Candle fetches are independent HTTP round trips, so a modest thread pool
+# overlaps them; the DB writes stay on the caller's single cursor.
+_CANDLE_FETCH_WORKERS = 8
+
+
+def _fetch_candles_concurrently(
+    client: KalshiSDKClient,
+    markets: Sequence[Dict[str, Any]],
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+) -> List[Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+    """Fetch candles for many markets in parallel, preserving input order.
+
+    Returns (market, candles, exception) triples; failures are captured per
+    market so the caller decides whether to fall back or re-raise.
+    """
+
+    def _fetch(market: Dict[str, Any]):
+        market_id = market.get("market_id")
+        series_ticker = market.get("series_ticker") or market.get("seriesTicker")
+        if not market_id or not series_ticker:
+            return market, None, None
+        try:
+            candles = client.get_market_candles(
+                series_ticker=series_ticker,
+                market_ticker=market_id,
+                start_ts=start_ts,
+                end_ts=end_ts,
+            )
+            return market, candles, None
+        except Exception as exc:
+            return market, None, exc
+
+    if len(markets) <= 1:
+        return [_fetch(market) for market in markets]
+    with ThreadPoolExecutor(max_workers=min(_CANDLE_FETCH_WORKERS, len(markets))) as pool:
+        return list(pool.map(_fetch, markets))
+
+
 def _ingest_market_candles(
     cursor,
     client: KalshiSDKClient,
     market: Dict[str, Any],
     start_ts: Optional[int] = None,
     end_ts: Optional[int] = None,
+    candles: Optional[List[Dict[str, Any]]] = None,
 ) -> int:
     market_id = market.get("market_id")
     series_ticker = market.get("series_ticker") or market.get("seriesTicker")
@@ -162,16 +299,16 @@ def _ingest_market_candles(
         LOGGER.warning("Skipping market without identifiers: %s", market)
         return 0
 
-    candles = client.get_market_candles(
-        series_ticker=series_ticker,
-        market_ticker=market_id,
-        start_ts=start_ts,
-        end_ts=end_ts,
-    )
-    inserted = 0
-    for row in _candles_to_price_rows(market_id, candles):
-        if insert_price(cursor, row):
-            inserted += 1
+    if candles is None:
+        candles = client.get_market_candles(
+            series_ticker=series_ticker,
+            market_ticker=market_id,
+            start_ts=start_ts,
+            end_ts=end_ts,
+        )
+    # One VALUES batch per market instead of an INSERT round trip per candle.
+    rows = list(_candles_to_price_rows(market_id, candles))
+    inserted = insert_prices(cursor, rows) if rows else 0
 
     # If no candles inserted, try a one-off snapshot so we have a price.
     if inserted == 0:
@@ -196,7 +333,7 @@ def _insert_quote_snapshot(cursor, client: KalshiSDKClient, market_id: str) -> i
         body = raw.data or raw.read()
         if not body:
             raise RuntimeError(f"Empty response from {url} (status={raw.status})")
-        payload = json.loads(body.decode("utf-8"))
+        payload = orjson.loads(body)
         return payload.get("market") or payload
 
     try:
@@ -247,6 +384,28 @@ def backfill_full_history(
     start_ts = int(start_ts_env) if start_ts_env else None
 
     with connection_ctx() as conn, conn.cursor() as cursor:
+        # Markets are upserted in batches; each batch is flushed before its
+        # candle ingestion so the prices FK always sees the market rows.
+        pending: List[Dict[str, Any]] = []
+
+        def _flush_batch() -> None:
+            upsert_markets(cursor, pending)
+            # Overlap the batch's candle fetches; writes stay sequential on
+            # this cursor.
+            for normalized, candles, exc in _fetch_candles_concurrently(
+                client, pending, start_ts=start_ts
+            ):
+                if exc is not None:
+                    raise exc
+                inserted = _ingest_market_candles(
+                    cursor, client, normalized, start_ts=start_ts, candles=candles
+                )
+                if inserted:
+                    LOGGER.info(
+                        "Market %s: inserted %d price rows", normalized["market_id"], inserted
+                    )
+            pending.clear()
+
         for idx, market in enumerate(client.iter_markets_allow_invalid(status=status)):
             if max_markets is not None and idx >= max_markets:
                 break
@@ -256,23 +415,28 @@ def backfill_full_history(
                 LOGGER.warning("Skipping market without id: %s", market)
                 continue
 
-            upsert_market(cursor, normalized)
-            inserted = _ingest_market_candles(cursor, client, normalized, start_ts=start_ts)
-            if inserted:
-                LOGGER.info("Market %s: inserted %d price rows", normalized["market_id"], inserted)
+            pending.append(normalized)
+            if len(pending) >= _MARKET_UPSERT_BATCH_SIZE:
+                _flush_batch()
+        _flush_batch()
         conn.commit()
 
 
+# Hoisted as a pre-encoded constant so repeat ingest runs reuse the query
+# text as-is. A server-side PREPARE (as the signal-update path uses) is
+# deliberately not applied here: this call runs mid-transaction alongside
+# uncommitted market upserts, so a later rollback could silently drop the
+# prepared statement while the session's tracking set still lists it.
+_RECENT_MARKETS_SQL = b"""
+    SELECT market_id
+    FROM markets
+    WHERE resolution IS NULL OR resolved_at >= %s
+"""
+
+
 def _recent_market_ids(conn, cutoff: datetime) -> Sequence[str]:
     with conn.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT market_id
-            FROM markets
-            WHERE resolution IS NULL OR resolved_at >= %s
-            """,
-            (cutoff,),
-        )
+        cursor.execute(_RECENT_MARKETS_SQL, (cutoff,))
         return [row[0] for row in cursor.fetchall()]
 
 
@@ -293,6 +457,9 @@ def ingest_recent(
     series_lookup: Dict[str, Optional[str]] = {}
 
     with connection_ctx() as conn, conn.cursor() as cursor:
+        # Accumulate market upserts and flush in batches; the remainder goes
+        # in before _recent_market_ids so the query sees every row.
+        pending: List[Dict[str, Any]] = []
         for idx, market in enumerate(client.iter_markets_allow_invalid(status=status)):
             if limit_markets is not None and limit_markets > 0 and idx >= limit_markets:
                 LOGGER.info("Stopping after %d markets due to limit", limit_markets)
@@ -300,8 +467,13 @@ def ingest_recent(
             normalized = normalize_market(market)
             if not normalized["market_id"]:
                 continue
-            upsert_market(cursor, normalized)
+            pending.append(normalized)
             series_lookup[normalized["market_id"]] = normalized.get("series_ticker")
+            if len(pending) >= _MARKET_UPSERT_BATCH_SIZE:
+                upsert_markets(cursor, pending)
+                pending.clear()
+        upsert_markets(cursor, pending)
+        pending.clear()
 
         target_ids = _recent_market_ids(conn, cutoff)
         if expire_within_hours is not None:
@@ -345,31 +517,45 @@ def ingest_recent(
                             continue
                         if not normalized.get("series_ticker"):
                             normalized["series_ticker"] = event_ticker
-                        upsert_market(cursor, normalized)
+                        pending.append(normalized)
                         series_lookup[normalized["market_id"]] = normalized.get("series_ticker")
                         target_ids.append(normalized["market_id"])
-        for market_id in target_ids:
-            normalized_market = {
+            # Flush event markets before the candle loop below inserts
+            # prices that reference them.
+            upsert_markets(cursor, pending)
+            pending.clear()
+        fetch_jobs = [
+            {
                 "market_id": market_id,
                 "series_ticker": series_lookup.get(market_id)
                 or (market_id.split(".")[0] if "." in market_id else market_id),
             }
-            try:
-                inserted = _ingest_market_candles(
-                    cursor,
-                    client,
-                    normalized_market,
-                    start_ts=start_ts,
-                    end_ts=end_ts,
-                )
-                if inserted:
-                    LOGGER.info("Inserted %d recent prices for %s", inserted, market_id)
-            except NotFoundException:
+            for market_id in target_ids
+        ]
+        # Fetch all candle windows concurrently, then apply them one by one
+        # on this connection; per-market fallbacks and commits are unchanged.
+        for normalized_market, candles, exc in _fetch_candles_concurrently(
+            client, fetch_jobs, start_ts=start_ts, end_ts=end_ts
+        ):
+            market_id = normalized_market["market_id"]
+            if isinstance(exc, NotFoundException):
                 LOGGER.warning("Candlesticks not found for %s; inserting snapshot instead", market_id)
                 snap = _insert_quote_snapshot(cursor, client, market_id)
                 if snap:
                     LOGGER.info("Inserted %d snapshot price for %s", snap, market_id)
                 continue
+            if exc is not None:
+                raise exc
+            inserted = _ingest_market_candles(
+                cursor,
+                client,
+                normalized_market,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                candles=candles,
+            )
+            if inserted:
+                LOGGER.info("Inserted %d recent prices for %s", inserted, market_id)
             conn.commit()
 
 
@@ -27,6 +27,23 @@ class KalshiClient:
         self.api_secret = api_secret
         self.env = env
         self.base_url = BASE_URLS[self.env]
+        # One long-lived client so sequential API hits reuse keepalive
+        # connections instead of paying a TCP+TLS handshake per request.
+        self._client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection pool."""
+
+        self._client.close()
+
+    def __enter__(self) -> "KalshiClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
 
     @classmethod
     def from_env(cls) -> "KalshiClient":
@@ -46,10 +63,9 @@ class KalshiClient:
     def _request(self, method: str, path: str, *, params: Dict[str, Any] | None = None) -> Any:
         url = f"{self.base_url}{path}"
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.request(method, url, headers=self._headers(), params=params)
-                response.raise_for_status()
-                return response.json()
+            response = self._client.request(method, url, headers=self._headers(), params=params)
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             LOGGER.error("Kalshi API error %s: %s", exc.response.status_code, exc.response.text)
             raise
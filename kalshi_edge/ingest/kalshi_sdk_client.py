@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-import json
+from functools import lru_cache
 from typing import Iterable, List, Optional
 from urllib.parse import urlencode
 
+import orjson
 from kalshi_python import ApiClient, Configuration
 from kalshi_python.api.markets_api import MarketsApi
 
@@ -73,7 +74,7 @@ class KalshiSDKClient:
             body = raw.data or raw.read()
             if not body:
                 raise RuntimeError(f"Empty response from {url} (status={raw.status})")
-            payload = json.loads(body.decode("utf-8"))
+            payload = orjson.loads(body)
             markets = payload.get("markets") or []
             LOGGER.info(
                 "Fetched %d markets (status=%s, cursor=%s)", len(markets), status, cursor
@@ -103,7 +104,7 @@ class KalshiSDKClient:
             body = raw.data or raw.read()
             if not body:
                 raise RuntimeError(f"Empty response from {url} (status={raw.status})")
-            payload = json.loads(body.decode("utf-8"))
+            payload = orjson.loads(body)
             events = payload.get("events") or []
             LOGGER.info("Fetched %d events (category=%s, cursor=%s)", len(events), category, cursor)
             for event in events:
@@ -125,9 +126,15 @@ class KalshiSDKClient:
         body = raw.data or raw.read()
         if not body:
             raise RuntimeError(f"Empty response from {url} (status={raw.status})")
-        return json.loads(body.decode("utf-8"))
-    def _normalize_interval(self, interval: str | int) -> str:
-        """Normalize interval formats ('1h', '5m', 60) into minute strings expected by API."""
+        return orjson.loads(body)
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _normalize_interval(interval: str | int) -> str:
+        """Normalize interval formats ('1h', '5m', 60) into minute strings expected by API.
+
+        Memoized: backfills call this once per candle fetch with a handful of
+        distinct inputs, so the string parsing runs only once each.
+        """
         if isinstance(interval, (int, float)):
             return str(int(interval))
         raw = str(interval).strip().lower()
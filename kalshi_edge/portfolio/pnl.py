@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
 
-from ..db import connection_ctx, get_connection
+from ..config import invalidate_bankroll_cache
+from ..db import borrowed_connection, connection_ctx
 from ..util.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -24,20 +25,14 @@ def _profit_no(avg_yes_price: float, trade_yes_price: float, direction: str, siz
     return delta * size if direction == "buy" else -delta * size
 
 
-def _update_position(cur: RealDictCursor, market_ticker: str, side: str, size_delta: int, price: float) -> Tuple[int, float, float]:
-    """Update positions table and return (new_size, avg_price, realized_delta)."""
-    cur.execute(
-        """
-        SELECT size, avg_entry_price, realized_pnl
-        FROM positions
-        WHERE market_ticker = %s AND side = %s
-        """,
-        (market_ticker, side),
-    )
-    row = cur.fetchone()
-    size_prev = row["size"] if row else 0
-    avg_prev = row["avg_entry_price"] if row else 0.0
-    realized_prev = row["realized_pnl"] if row else 0.0
+def _position_math(
+    size_prev: int, avg_prev: float, size_delta: int, price: float, side_is_yes: bool
+) -> Tuple[int, float, float]:
+    """Pure position arithmetic: return (size_new, avg_new, realized_delta).
+
+    Kept free of cursors and row objects so replay/backtest loops can call
+    it directly on plain numbers.
+    """
 
     realized_delta = 0.0
     size_new = size_prev + size_delta
@@ -50,7 +45,7 @@ def _update_position(cur: RealDictCursor, market_ticker: str, side: str, size_de
     else:
         # Closing/flip
         closing = min(abs(size_prev), abs(size_delta))
-        if side == "yes":
+        if side_is_yes:
             realized_delta = _profit_yes(avg_prev, price, "sell" if size_prev > 0 else "buy", closing)
         else:
             realized_delta = _profit_no(avg_prev, price, "buy" if size_prev < 0 else "sell", closing)
@@ -63,6 +58,27 @@ def _update_position(cur: RealDictCursor, market_ticker: str, side: str, size_de
         else:
             avg_new = avg_prev
 
+    return size_new, avg_new, realized_delta
+
+
+def _update_position(cur, market_ticker: str, side: str, size_delta: int, price: float) -> Tuple[int, float, float]:
+    """Update positions table and return (new_size, avg_price, realized_delta)."""
+    cur.execute(
+        """
+        SELECT size, avg_entry_price, realized_pnl
+        FROM positions
+        WHERE market_ticker = %s AND side = %s
+        """,
+        (market_ticker, side),
+    )
+    row = cur.fetchone()
+    size_prev = int(row[0]) if row else 0
+    avg_prev = float(row[1] or 0.0) if row else 0.0
+
+    size_new, avg_new, realized_delta = _position_math(
+        size_prev, avg_prev, size_delta, float(price), side == "yes"
+    )
+
     cur.execute(
         """
         INSERT INTO positions (market_ticker, side, size, avg_entry_price, realized_pnl, updated_at)
@@ -78,27 +94,59 @@ def _update_position(cur: RealDictCursor, market_ticker: str, side: str, size_de
     return size_new, avg_new, realized_delta
 
 
+_TRADE_INSERT_SQL = """
+    INSERT INTO trades (signal_id, market_ticker, side, size, price, direction, executed_at)
+    VALUES %s
+"""
+_TRADE_INSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()))"
+
+
+def record_trades(trades: List[Dict[str, Any]], conn=None) -> None:
+    """Persist a batch of trades and update positions in one transaction.
+
+    The trade rows go in as a single VALUES insert; position upkeep stays
+    per-trade because each fill's realized PnL depends on the position state
+    left by the previous one.
+
+    When ``conn`` is given the writes join the caller's open transaction and
+    are left uncommitted, so callers can commit them atomically with their
+    own bookkeeping (and must invalidate the bankroll cache after doing so).
+    """
+
+    if not trades:
+        return
+    with borrowed_connection(conn) as c:
+        with c.cursor() as cur:
+            execute_values(
+                cur,
+                _TRADE_INSERT_SQL,
+                [
+                    (
+                        trade.get("signal_id"),
+                        trade["market_ticker"],
+                        trade["side"],
+                        trade["size"],
+                        trade["price"],
+                        trade["direction"],
+                        trade.get("executed_at"),
+                    )
+                    for trade in trades
+                ],
+                template=_TRADE_INSERT_TEMPLATE,
+            )
+            for trade in trades:
+                size_delta = trade["size"] if trade["direction"] == "buy" else -trade["size"]
+                _update_position(
+                    cur, trade["market_ticker"], trade["side"], size_delta, trade["price"]
+                )
+        if conn is None:
+            c.commit()
+            invalidate_bankroll_cache()
+
+
 def record_trade(trade: Dict[str, Any]) -> None:
     """Persist trade and update positions/PnL."""
-    with get_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(
-            """
-            INSERT INTO trades (signal_id, market_ticker, side, size, price, direction, executed_at)
-            VALUES (%s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()))
-            """,
-            (
-                trade.get("signal_id"),
-                trade["market_ticker"],
-                trade["side"],
-                trade["size"],
-                trade["price"],
-                trade["direction"],
-                trade.get("executed_at"),
-            ),
-        )
-        size_delta = trade["size"] if trade["direction"] == "buy" else -trade["size"]
-        _update_position(cur, trade["market_ticker"], trade["side"], size_delta, trade["price"])
-        conn.commit()
+    record_trades([trade])
 
 
 def snapshot_account_pnl(as_of: Optional[datetime] = None) -> None:
@@ -107,32 +155,36 @@ def snapshot_account_pnl(as_of: Optional[datetime] = None) -> None:
     as_of_date = as_of.date()
 
     with connection_ctx() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # realized
-            cur.execute("SELECT COALESCE(SUM(realized_pnl),0) AS realized FROM positions")
-            realized = float(cur.fetchone()["realized"])
-
-            # latest prices per market
+        with conn.cursor() as cur:
+            # Realized and unrealized in one aggregate: the LATERAL seeks the
+            # latest price per position, replacing the former three queries
+            # plus Python loop (which also scanned the whole prices table for
+            # markets nobody holds). Positions without a price contribute
+            # realized PnL only, as before.
             cur.execute(
                 """
-                SELECT DISTINCT ON (market_id) market_id, last_yes
-                FROM prices
-                ORDER BY market_id, timestamp DESC
+                SELECT
+                    COALESCE(SUM(p.realized_pnl), 0)::float8 AS realized,
+                    COALESCE(SUM(
+                        CASE
+                            WHEN lp.last_yes IS NULL THEN 0
+                            WHEN p.side = 'yes' THEN (lp.last_yes - p.avg_entry_price) * p.size
+                            ELSE (p.avg_entry_price - lp.last_yes) * p.size
+                        END
+                    ), 0)::float8 AS unrealized
+                FROM positions p
+                LEFT JOIN LATERAL (
+                    SELECT last_yes
+                    FROM prices
+                    WHERE market_id = p.market_ticker
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                ) lp ON TRUE
                 """
             )
-            latest = {row["market_id"]: row["last_yes"] for row in cur.fetchall()}
-
-            # unrealized from positions
-            cur.execute("SELECT market_ticker, side, size, avg_entry_price FROM positions")
-            unrealized = 0.0
-            for row in cur.fetchall():
-                last = latest.get(row["market_ticker"])
-                if last is None:
-                    continue
-                if row["side"] == "yes":
-                    unrealized += (last - row["avg_entry_price"]) * row["size"]
-                else:
-                    unrealized += (row["avg_entry_price"] - last) * row["size"]
+            row = cur.fetchone()
+            realized = float(row[0])
+            unrealized = float(row[1])
 
             total_equity = realized + unrealized
             cur.execute(
@@ -147,9 +199,10 @@ def snapshot_account_pnl(as_of: Optional[datetime] = None) -> None:
                 (as_of_date, realized, unrealized, total_equity),
             )
             conn.commit()
+    invalidate_bankroll_cache()
 
 
-__all__ = ["record_trade", "snapshot_account_pnl"]
+__all__ = ["record_trade", "record_trades", "snapshot_account_pnl"]
 
 
 def main() -> None:  # pragma: no cover - CLI helper
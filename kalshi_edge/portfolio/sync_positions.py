@@ -6,9 +6,10 @@ positions untouched. Extend as the SDK surface improves.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from kalshi_python.api.portfolio_api import PortfolioApi
+from psycopg2.extras import execute_values
 
 from ..config import get_kalshi_creds, get_kalshi_env
 from ..db import connection_ctx
@@ -32,35 +33,45 @@ def sync_positions() -> int:
 
     resp = api.get_positions()
     positions = resp.positions or []
-    updated = 0
+
+    rows: List[Tuple[str, str, int, float]] = []
+    for pos in positions:
+        ticker = getattr(pos, "ticker", None)
+        count = getattr(pos, "position", None)
+        cost_cents = getattr(pos, "total_cost", None)
+        if ticker is None or count is None or cost_cents is None:
+            continue
+        if count == 0:
+            continue
+        avg_price = (cost_cents / 100.0) / abs(count)
+        rows.append((ticker, "yes", count, avg_price))
 
     with connection_ctx() as conn, conn.cursor() as cur:
-        # Reset to reflect current portfolio; avoids stale/cancelled orders lingering locally.
-        cur.execute("TRUNCATE positions;")
-        for pos in positions:
-            ticker = getattr(pos, "ticker", None)
-            count = getattr(pos, "position", None)
-            cost_cents = getattr(pos, "total_cost", None)
-            if ticker is None or count is None or cost_cents is None:
-                continue
-            if count == 0:
-                continue
-            avg_price = (cost_cents / 100.0) / abs(count)
-            cur.execute(
+        # Upsert the whole snapshot in one statement, then drop rows the API
+        # no longer reports. NOW() is the transaction timestamp, so refreshed
+        # rows carry exactly snapshot_ts and survive the strict-< delete;
+        # this replaces the old TRUNCATE + per-row reinsert and its table
+        # lock while still clearing stale/cancelled positions.
+        cur.execute("SELECT NOW()")
+        snapshot_ts = cur.fetchone()[0]
+        if rows:
+            execute_values(
+                cur,
                 """
                 INSERT INTO positions (market_ticker, side, size, avg_entry_price, updated_at)
-                VALUES (%s, %s, %s, %s, NOW())
+                VALUES %s
                 ON CONFLICT (market_ticker, side) DO UPDATE SET
                   size = EXCLUDED.size,
                   avg_entry_price = EXCLUDED.avg_entry_price,
-                  updated_at = NOW()
+                  updated_at = EXCLUDED.updated_at
                 """,
-                (ticker, "yes", count, avg_price),
+                rows,
+                template="(%s, %s, %s, %s, NOW())",
             )
-            updated += 1
+        cur.execute("DELETE FROM positions WHERE updated_at < %s", (snapshot_ts,))
         conn.commit()
 
-    return updated
+    return len(rows)
 
 
 if __name__ == "__main__":
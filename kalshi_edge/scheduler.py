@@ -8,10 +8,10 @@ import schedule
 
 from .backtest import calibration as calibration_mod
 from .backtest.results_store import (
-    save_backtest_result,
+    save_backtest_results,
     save_calibration_result,
 )
-from .backtest.strategy_threshold import run_threshold_backtest
+from .backtest.strategy_threshold import run_threshold_sweep
 from .ingest import historical_ingest
 from .signals.generate_signals import generate_signals
 from .signals.manage_signals import cancel_stale_signals
@@ -95,30 +95,35 @@ def run_all_backtests() -> None:
 
     LOGGER.info("Running scheduled backtests and calibration")
 
+    # Collect every sweep result and insert them in one batch at the end
+    # instead of paying a round trip + commit per threshold. The sweep runner
+    # overlaps the per-threshold queries across pooled connections.
+    sweep_results = []
+    jobs = [(t, "yes") for t in HIGH_THRESHOLDS] + [(t, "no") for t in LOW_THRESHOLDS]
     for cat in CATEGORIES:
         for bucket in EXPIRY_BUCKETS:
-            # YES-buying thresholds
-            for t in HIGH_THRESHOLDS:
-                stats, _ = run_threshold_backtest(
-                    threshold=t,
-                    direction="yes",
-                    category=cat,
-                    expiry_bucket=bucket,
-                    since_hours=BACKTEST_SINCE_HOURS,
-                    allowed_categories=BACKTEST_ALLOWED_CATEGORIES,
-                )
-                save_backtest_result(
-                    strategy_name=f"threshold_yes_{t:.2f}",
-                    params={
-                        "threshold": t,
-                        "direction": "yes",
-                        "category": cat,
-                        "expiry_bucket": bucket,
-                    },
-                    summary=stats,
+            for t, direction, stats in run_threshold_sweep(
+                jobs,
+                category=cat,
+                expiry_bucket=bucket,
+                since_hours=BACKTEST_SINCE_HOURS,
+                allowed_categories=BACKTEST_ALLOWED_CATEGORIES,
+            ):
+                sweep_results.append(
+                    (
+                        f"threshold_{direction}_{t:.2f}",
+                        {
+                            "threshold": t,
+                            "direction": direction,
+                            "category": cat,
+                            "expiry_bucket": bucket,
+                        },
+                        stats,
+                    )
                 )
                 LOGGER.info(
-                    "YES threshold %.2f cat=%s bucket=%s: trades=%s win_rate=%.2f%% total_profit=%.4f",
+                    "%s threshold %.2f cat=%s bucket=%s: trades=%s win_rate=%.2f%% total_profit=%.4f",
+                    direction.upper(),
                     t,
                     cat,
                     bucket,
@@ -127,35 +132,8 @@ def run_all_backtests() -> None:
                     stats["total_profit"],
                 )
 
-            # NO-buying thresholds
-            for t in LOW_THRESHOLDS:
-                stats, _ = run_threshold_backtest(
-                    threshold=t,
-                    direction="no",
-                    category=cat,
-                    expiry_bucket=bucket,
-                    since_hours=BACKTEST_SINCE_HOURS,
-                    allowed_categories=BACKTEST_ALLOWED_CATEGORIES,
-                )
-                save_backtest_result(
-                    strategy_name=f"threshold_no_{t:.2f}",
-                    params={
-                        "threshold": t,
-                        "direction": "no",
-                        "category": cat,
-                        "expiry_bucket": bucket,
-                    },
-                    summary=stats,
-                )
-                LOGGER.info(
-                    "NO threshold %.2f cat=%s bucket=%s: trades=%s win_rate=%.2f%% total_profit=%.4f",
-                    t,
-                    cat,
-                    bucket,
-                    stats["num_trades"],
-                    stats["win_rate"] * 100,
-                    stats["total_profit"],
-                )
+    save_backtest_results(sweep_results)
+    LOGGER.info("Saved %s backtest results in one batch", len(sweep_results))
 
     bin_edges = calibration_mod.EXTREME_BIN_EDGES
     buckets = calibration_mod.compute_calibration_with_bins(bin_edges=bin_edges)
@@ -118,14 +118,16 @@ def _parse_market_date(text: Optional[str]) -> Optional[datetime]:
     return parsed
 
 
-def _expiry_bucket(expiration_ts: Optional[datetime]) -> Optional[str]:
+def _expiry_bucket(
+    expiration_ts: Optional[datetime], short_end: datetime, medium_end: datetime
+) -> Optional[str]:
+    # Cutoffs are precomputed once per run; classifying a market is then two
+    # plain comparisons with no clock read or timedelta arithmetic per row.
     if not expiration_ts:
         return None
-    now = datetime.now(timezone.utc)
-    delta = expiration_ts - now
-    if delta <= timedelta(days=1):
+    if expiration_ts <= short_end:
         return "short"
-    if delta <= timedelta(days=7):
+    if expiration_ts <= medium_end:
         return "medium"
     return "long"
 
@@ -137,6 +139,8 @@ def generate_signals(ev_threshold: float = EV_THRESHOLD_DEFAULT, max_signals: in
     created = 0
     now = datetime.now(timezone.utc)
     hard_cutoff_default = now + timedelta(hours=EXPIRY_HARD_LIMIT_HOURS)
+    bucket_short_end = now + timedelta(days=1)
+    bucket_medium_end = now + timedelta(days=7)
 
     with get_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
         prices = _latest_prices(cursor)
@@ -185,7 +189,7 @@ def generate_signals(ev_threshold: float = EV_THRESHOLD_DEFAULT, max_signals: in
                     market_name,
                 )
                 continue
-            bucket = _expiry_bucket(exp_ts)
+            bucket = _expiry_bucket(exp_ts, bucket_short_end, bucket_medium_end)
 
             price = float(p_mkt)
 
@@ -0,0 +1,10 @@
+-- Support the dashboard's ORDER BY ... DESC LIMIT N queries with matching
+-- indexes so Postgres can walk the index instead of sorting the whole table.
+CREATE INDEX IF NOT EXISTS idx_trades_executed_at_desc
+  ON trades (executed_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_account_pnl_date_desc
+  ON account_pnl (as_of_date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_positions_updated_at_desc
+  ON positions (updated_at DESC);
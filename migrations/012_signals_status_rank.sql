@@ -0,0 +1,18 @@
+-- Materialize the signal status display priority as a generated column so the
+-- dashboard's ORDER BY no longer evaluates a CASE per row and can use an index.
+ALTER TABLE signals
+  ADD COLUMN IF NOT EXISTS status_rank SMALLINT GENERATED ALWAYS AS (
+    CASE status
+      WHEN 'pending'   THEN 0
+      WHEN 'resting'   THEN 1
+      WHEN 'sent'      THEN 2
+      WHEN 'simulated' THEN 3
+      WHEN 'executed'  THEN 4
+      WHEN 'ignored'   THEN 5
+      WHEN 'error'     THEN 6
+      ELSE 7
+    END
+  ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_signals_status_rank_created
+  ON signals (status_rank, created_at DESC);
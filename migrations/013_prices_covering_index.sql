@@ -0,0 +1,8 @@
+-- Cover the hot "per-market, newest/earliest price" scans (calibration's
+-- DISTINCT ON join, the backtest's batched first-entry query) with an
+-- index-only path:
+-- the planner can walk (market_id, timestamp DESC) and read the quote
+-- columns straight from the index without touching the heap.
+CREATE INDEX IF NOT EXISTS idx_prices_market_ts_covering
+  ON prices (market_id, timestamp DESC)
+  INCLUDE (bid_yes, ask_yes, last_yes, volume, open_interest);
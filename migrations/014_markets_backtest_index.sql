@@ -0,0 +1,5 @@
+-- Support the backtest's resolved-markets scan now that category and expiry
+-- filters run in the WHERE clause instead of Python.
+CREATE INDEX IF NOT EXISTS idx_markets_resolved_category_expiry
+  ON markets (category, expiration_ts)
+  WHERE resolution IS NOT NULL;
@@ -0,0 +1,7 @@
+-- Signal writers already emit lowercase 'yes'/'no'; pin that at the schema
+-- level so risk math can trust the stored value and skip per-row
+-- normalization. NOT VALID keeps the migration cheap and tolerant of any
+-- pre-existing rows; new writes are checked.
+ALTER TABLE signals DROP CONSTRAINT IF EXISTS signals_side_check;
+ALTER TABLE signals ADD CONSTRAINT signals_side_check
+  CHECK (side IN ('yes', 'no')) NOT VALID;
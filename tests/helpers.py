@@ -19,10 +19,57 @@ class FakeCursor:
 
     def execute(self, query: str, params: Iterable | None = None) -> None:
         params = list(params or [])
+        if "DISTINCT ON (p.market_id)" in query:
+            # Emulate the joined latest-price-per-resolved-market query;
+            # tuples in SELECT order, as returned by the plain cursor.
+            result = []
+            for market in self._markets:
+                if market.get("resolution") is None:
+                    continue
+                rows = list(self._prices.get(market["market_id"], []))
+                resolved_at = market.get("resolved_at")
+                if resolved_at is not None:
+                    rows = [row for row in rows if row["timestamp"] <= resolved_at]
+                if not rows:
+                    continue
+                latest = max(rows, key=lambda r: r["timestamp"])
+                result.append(
+                    (
+                        market["market_id"],
+                        market["resolution"],
+                        latest.get("bid_yes"),
+                        latest.get("ask_yes"),
+                        latest.get("last_yes"),
+                    )
+                )
+            self._result = result
+            return
+
         if "FROM markets" in query:
             self._result = list(self._markets)
             return
 
+        if "bid_yes + ask_yes" in query:
+            # Emulate the batched first-entry query: mid price threshold,
+            # open-interest floor, earliest qualifying row per market.
+            market_ids, threshold, min_oi = params
+            is_le = "last_yes) <=" in query
+            result = []
+            for market_id in market_ids:
+                for row in sorted(self._prices.get(market_id, []), key=lambda r: r["timestamp"]):
+                    bid, ask, last = row.get("bid_yes"), row.get("ask_yes"), row.get("last_yes")
+                    mid = (bid + ask) / 2.0 if bid is not None and ask is not None else last
+                    if mid is None:
+                        continue
+                    oi = row.get("open_interest")
+                    if oi is not None and oi < min_oi:
+                        continue
+                    if (mid <= threshold) if is_le else (mid >= threshold):
+                        result.append((market_id, row["timestamp"], bid, ask, last))
+                        break
+            self._result = result
+            return
+
         if "FROM prices" in query:
             market_id = params[0] if params else None
             rows = list(self._prices.get(market_id, []))
@@ -47,13 +94,16 @@ class FakeCursor:
     def fetchone(self) -> dict | None:
         return self._result[0] if self._result else None
 
+    def __iter__(self):
+        return iter(list(self._result))
+
 
 class FakeConnection:
     def __init__(self, markets: List[dict], prices: Dict[str, List[dict]]):
         self._markets = markets
         self._prices = prices
 
-    def cursor(self, cursor_factory=None):  # pragma: no cover - signature parity only
+    def cursor(self, name=None, cursor_factory=None):  # pragma: no cover - signature parity only
         return FakeCursor(self._markets, self._prices)
 
     def close(self) -> None:  # pragma: no cover - compatibility hook